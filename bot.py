@@ -200,8 +200,12 @@ class ZerolanLiveRobot(BaseBot):
         def on_service_vad_speech_chunk(event: DeviceMicrophoneVADEvent):
             logger.debug("`SpeechEvent` received.")
             speech, channels, sample_rate = event.speech, event.channels, event.sample_rate
+            media_type = event.audio_type.value
+            if event.raw_pcm is not None and self.asr.supports_raw_pcm:
+                # Let the ASR pipeline build the WAV container itself, at the upload boundary
+                speech, media_type = event.raw_pcm, AudioFileType.RAW.value
             query = ASRStreamQuery(is_final=True, audio_data=speech, channels=channels, sample_rate=sample_rate,
-                                   media_type=event.audio_type.value)
+                                   media_type=media_type)
 
             for prediction in self.asr.stream_predict(query):
                 logger.info(f"ASR: {prediction.transcript}")
@@ -321,17 +325,16 @@ class ZerolanLiveRobot(BaseBot):
                 emitter.emit(PipelineImgCapEvent(prediction=img_cap_prediction))
 
         def predict_image_modal(images: List[Path]):
+            img_paths = [str(image) for image in images if image.exists()]
+            ocr_predictions = self.ocr.predict_batch([OCRQuery(img_path=img_path) for img_path in img_paths])
+            img_cap_predictions = self.img_cap.predict_batch(
+                [ImgCapQuery(prompt="There", img_path=img_path) for img_path in img_paths])
             results = []
-            for image in images:
-                if image.exists():
-                    ocr_prediction = self.ocr.predict(OCRQuery(img_path=str(image)))
-                    ocr_text = stringify(ocr_prediction.region_results)
-                    img_cap_prediction = self.img_cap.predict(ImgCapQuery(prompt="There", img_path=str(image)))
-                    img_cap_text = img_cap_prediction.caption
-                    results.append({
-                        "ocr": ocr_text,
-                        "sentiment": img_cap_text
-                    })
+            for ocr_prediction, img_cap_prediction in zip(ocr_predictions, img_cap_predictions):
+                results.append({
+                    "ocr": stringify(ocr_prediction.region_results),
+                    "sentiment": img_cap_prediction.caption
+                })
             return results
 
         @emitter.on(EventKeyRegistry.QQBot.QQ_MESSAGE)
@@ -2,11 +2,11 @@ from enum import Enum
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
-from typeguard import typechecked
 
 from common import ver_check
 from common.decorator import log_run_time
 from common.utils.time_util import get_time_iso_string
+from common.utils.type_util import typechecked
 
 
 class ConfigFileGenerator:
@@ -6,10 +6,10 @@ import gradio as gr
 from loguru import logger
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
-from typeguard import typechecked
 
 from common import ver_check
 from common.utils.enum_util import enum_members_to_str_list
+from common.utils.type_util import typechecked
 from event.event_data import ConfigFileModifiedEvent
 from event.event_emitter import emitter
 from manager.config_manager import save_config
@@ -1,10 +1,9 @@
 from pathlib import Path
 
-from typeguard import typechecked
-
 from common.io.file_sys import fs
 from common.io.file_type import AudioFileType, ImageFileType
 from common.utils.audio_util import get_audio_real_format
+from common.utils.type_util import typechecked
 
 
 @typechecked
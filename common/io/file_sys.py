@@ -4,9 +4,8 @@ import zipfile
 from pathlib import Path
 from typing import Literal
 
-from typeguard import typechecked
-
 from common.utils.time_util import get_time_string
+from common.utils.type_util import typechecked
 
 ResType = Literal["image", "video", "audio", "model"]
 
@@ -6,9 +6,9 @@ import numpy as np
 import soundfile as sf
 from pydub import AudioSegment
 from scipy.io import wavfile as wavfile
-from typeguard import typechecked
 
 from common.io.file_type import AudioFileType
+from common.utils.type_util import typechecked
 
 
 @typechecked
@@ -1,28 +1,28 @@
 from enum import Enum
-from typing import Type, Any, List
-
-from typeguard import typechecked
+from functools import lru_cache
+from typing import Type, Any, List, Tuple
 
 
 def enum_members_to_list(enum: Type[Enum]) -> List[Any]:
     return [member.value for member in enum]
 
 
-@typechecked
+@lru_cache(maxsize=None)
+def _enum_members_to_str_tuple(enum: Type[Enum]) -> Tuple[str, ...]:
+    return tuple(str(elm.value) for elm in enum)
+
+
 def enum_members_to_str_list(enum: Type[Enum]) -> List[str]:
-    return [str(elm.value) for elm in list(enum)]
+    # 返回新列表, 调用方修改时不会污染缓存
+    return list(_enum_members_to_str_tuple(enum))
 
 
-@typechecked
+@lru_cache(maxsize=None)
 def _enum_members_to_plain_text_with_comma(enum: Type[Enum]) -> str:
-    str_list = enum_members_to_str_list(enum)
-    text = ""
-    for string in str_list:
-        text += "`" + string + "`" + ", "
-    return text[:-2]
+    return ", ".join(f"`{string}`" for string in _enum_members_to_str_tuple(enum))
 
 
-@typechecked
+@lru_cache(maxsize=None)
 def enum_to_markdown(enum: Type[Enum]) -> str:
     num_of_enum = len(enum)
     if num_of_enum == 1:
@@ -32,7 +32,7 @@ def enum_to_markdown(enum: Type[Enum]) -> str:
         return f"{candidates} are supported."
 
 
-@typechecked
+@lru_cache(maxsize=None)
 def enum_to_markdown_zh(enum: Type[Enum]) -> str:
     num_of_enum = len(enum)
     if num_of_enum == 1:
@@ -42,12 +42,20 @@ def enum_to_markdown_zh(enum: Type[Enum]) -> str:
         return f"支持 {candidates}。"
 
 
-def try_get_pynput_key_enum_str():
+# Cached description of pynput key names, importing pynput pulls in the Win32/X11 hooks
+_PYNPUT_KEY_DESC: str | None = None
+
+
+def try_get_pynput_key_enum_str() -> str:
+    global _PYNPUT_KEY_DESC
+    if _PYNPUT_KEY_DESC is not None:
+        return _PYNPUT_KEY_DESC
     try:
         from pynput.keyboard import Key
 
-        return '`' + '`, `'.join(list(Key.__members__.keys())[:40]) + '`'
+        _PYNPUT_KEY_DESC = '`' + '`, `'.join(list(Key.__members__.keys())[:40]) + '`'
     except ImportError:
         from loguru import logger
         logger.warning(f'Pynput not installed, please try "pip install pynput" to solve this problem.')
-        return '`Error: Please install `pynput` and try again`'
+        _PYNPUT_KEY_DESC = '`Error: Please install `pynput` and try again`'
+    return _PYNPUT_KEY_DESC
@@ -2,8 +2,7 @@ import os.path
 from pathlib import Path
 from uuid import uuid4
 
-from typeguard import typechecked
-
+from common.utils.type_util import typechecked
 from services.playground.data import FileInfo
 
 
@@ -1,7 +1,42 @@
+import mmap
+import os
+from functools import lru_cache
+
 from PIL.Image import Image
 
+try:
+    # SIMD-accelerated, several times faster than the standard library on large payloads
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
 
 def is_image_uniform(img: Image):
     gray_img = img.convert('L')
     min_value, max_value = gray_img.getextrema()
     return min_value == max_value
+
+
+# 截图每次都是新的临时文件, 只有紧挨着的 OCR + ImgCap 会命中, 缓存保持很小, 避免常驻大量 base64 字符串
+@lru_cache(maxsize=4)
+def _b64_image(img_path: str, stat_key: tuple) -> str:
+    # stat_key 只用于缓存键: 文件被覆盖或修改后 (st_dev, st_ino, st_mtime_ns, st_size) 会变, 缓存自然失效
+    with open(img_path, 'rb') as f:
+        if stat_key[-1] == 0:
+            return "data:image/jpeg;base64,"
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                b64 = b64encode(view).decode('ascii')
+    return f"data:image/jpeg;base64,{b64}"
+
+
+def image_file_to_data_url(img_path: str) -> str:
+    """
+    Read an image file and convert it to a `data:image/jpeg;base64,...` URL.
+    The last few results are cached by the file's identity and modification time, so encoding the same file
+    twice in a row (e.g. OCR and ImgCap on one screenshot) only reads and encodes it once.
+    :param img_path: Path of the image file.
+    :return: Data URL ready to be embedded in an OpenAI-compatible `image_url` message.
+    """
+    st = os.stat(img_path)
+    return _b64_image(img_path, (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size))
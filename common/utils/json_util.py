@@ -8,6 +8,26 @@ Notes:
 import json
 from json import JSONDecodeError
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def fast_json_loads(content: bytes | str):
+    """
+    解析 JSON, 安装了 orjson 时使用 orjson (更快), 否则回退到标准库 json。
+    Args:
+        content: JSON 字节串或字符串。
+
+    Returns: 解析后的 Python 对象。
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 def _extract_json_from_text(text: str):
     """
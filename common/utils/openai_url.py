@@ -0,0 +1,12 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def normalize(url: str) -> str:
+    """
+    Ensure base_url ends with /v1 for OpenAI compatibility.
+    :param url: Base URL of an OpenAI-compatible API service.
+    :return: Normalized base URL, e.g. `https://api.openai.com/` -> `https://api.openai.com/v1`.
+    """
+    url = url.rstrip('/')
+    return url if url.endswith('/v1') else url + '/v1'
@@ -32,6 +32,9 @@ def split_by_punc(text: str, lang: Language) -> List[str]:
     return punc_cut(text, cut_punc)
 
 
+_FENCE_RE = re.compile(r'^```[\w]*\n?(.*?)\n?```$', re.DOTALL)
+
+
 def remove_md_blocks(text: Optional[str]) -> Optional[str]:
     """
     Remove Markdown blocks from a string.
@@ -42,8 +45,11 @@ def remove_md_blocks(text: Optional[str]) -> Optional[str]:
 
     text = text.strip()
 
-    pattern = r'^```[\w]*\n?(.*?)\n?```$'
-    match = re.match(pattern, text, re.DOTALL)
+    # Most replies have no fences at all, skip the regex for them
+    if not (text.startswith('```') and text.endswith('```')):
+        return text
+
+    match = _FENCE_RE.match(text)
 
     if match:
         return match.group(1).strip()
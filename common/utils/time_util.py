@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from typeguard import typechecked
+from common.utils.type_util import typechecked
 
 
 @typechecked
@@ -0,0 +1,17 @@
+import os
+
+from typeguard import typechecked as _typechecked
+
+# Runtime type checking walks every annotation on every call, so it is only enabled on demand.
+# Set the environment variable `ZLR_TYPECHECK=1` (e.g. in CI or while debugging) to turn it on.
+TYPECHECK = os.getenv('ZLR_TYPECHECK') == '1'
+
+
+def _no_typecheck(target=None, **kwargs):
+    # Support both `@typechecked` and `@typechecked(...)` usages
+    if target is None:
+        return lambda f: f
+    return target
+
+
+typechecked = _typechecked if TYPECHECK else _no_typecheck
@@ -0,0 +1,33 @@
+import struct
+
+WAV_HEADER_SIZE = 44
+
+
+def make_wav_header_template(channels: int, sample_rate: int, sample_width: int = 2) -> bytes:
+    """
+    Build a 44-byte PCM RIFF/WAVE header whose two size fields are left as 0.
+    Use `fill_wav_header` to patch in the sizes for a concrete payload.
+    :param channels: Number of audio channels.
+    :param sample_rate: Sample rate in Hz.
+    :param sample_width: Bytes per sample, 2 for 16-bit PCM.
+    :return: Header template bytes.
+    """
+    return struct.pack('<4sI4s4sIHHIIHH4sI',
+                       b'RIFF', 0, b'WAVE', b'fmt ', 16, 1,
+                       channels, sample_rate,
+                       sample_rate * channels * sample_width,
+                       channels * sample_width,
+                       sample_width * 8, b'data', 0)
+
+
+def fill_wav_header(template: bytes, data_size: int) -> bytes:
+    """
+    Patch the RIFF chunk size and the data chunk size into a header template.
+    :param template: Header from `make_wav_header_template`.
+    :param data_size: Length of the raw PCM payload in bytes.
+    :return: Complete WAV header.
+    """
+    header = bytearray(template)
+    struct.pack_into('<I', header, 4, WAV_HEADER_SIZE - 8 + data_size)
+    struct.pack_into('<I', header, 40, data_size)
+    return bytes(header)
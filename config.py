@@ -5,6 +5,9 @@ from common.utils.enum_util import try_get_pynput_key_enum_str
 from pipeline.base.config import PipelineConfig
 from services.config import ServiceConfig
 
+_MIC_HOTKEY_DESC = ("Your microphone is set to be off when the program starts. One tap on this hotkey will change its status between on and off.\n"
+                    "You can pick your own hotkey on Key names like: " + try_get_pynput_key_enum_str() + " ...")
+
 
 class SystemConfig(BaseModel):
     default_enable_microphone: bool = Field(default=False,
@@ -13,10 +16,7 @@ class SystemConfig(BaseModel):
     microphone_vad_mode: int = Field(default=3,
                                      description="Optionally, set its aggressiveness mode, which is an integer between 0 and 3. " \
                                                  "0 is the least aggressive about filtering out non-speech, 3 is the most aggressive.")
-    microphone_hotkey: str = Field(default='f8',
-                                   description="Your microphone is set to be off when the program starts. One tap on this hotkey will change its status between on and off.\n" \
-                                               "You can pick your own hotkey on Key names like: {} ...".format(
-                                       try_get_pynput_key_enum_str()))
+    microphone_hotkey: str = Field(default='f8', description=_MIC_HOTKEY_DESC)
     enable_clause_split: bool = Field(default=True,
                                       description='If `True`, splits LLM responses into smaller clauses before sending to TTS service. '
                                                   'This enables faster audio generation and reduced latency for real-time applications. \n'
@@ -14,6 +14,10 @@ if not is_headless():
     except:
         raise ImportError(f'Pynput not installed, please try "pip install pynput" to solve this problem.')
 
+    # 预先构建小写键名到 Key 的映射, 避免每次查找都访问 Key.__members__
+    _KEY_NAME_MAP: dict = {name.lower(): k for name, k in Key.__members__.items()}
+    _KEY_NAME_HINT: str = ', '.join(list(Key.__members__.keys())[:20])
+
 """
 Keyborad 函数只监听所有特定的按键, 并触发控制函数 hotkey_handler
 (目前只在 Windows11 下测试过)
@@ -21,14 +25,19 @@ Keyborad 函数只监听所有特定的按键, 并触发控制函数 hotkey_hand
 class SmartKeyboard(ThreadRunnable):
     def __init__(self, hotkeys: list):
         super().__init__()
-        self._hotkeys = set()
+        resolved = set()
         for string in hotkeys:
             assert type(string) is str, "hotkeys must be string type"
-            if string in self._hotkeys:
-                assert False, "some hotkeys are set to be the same, please check your config.yaml setting"
-            self._hotkeys.add(self.str_to_key(string))
+            # 按解析后的按键判重, "f8" 与 "F8" 也算重复
+            key = self.str_to_key(string)
+            if key in resolved:
+                raise ValueError("some hotkeys are set to be the same, please check your config.yaml setting")
+            resolved.add(key)
+        self._hotkeys = frozenset(resolved)
         self._current_hotkey: Union[Key, KeyCode] = None
         self._toggle_debounce: bool = False   # 防抖
+        # 保护 _toggle_debounce 与 _current_hotkey 的同时更新, 避免多键快速按下时的竞态
+        self._debounce_lock = threading.Lock()
         self._key_listener = keyboard.Listener(
             on_press=self._on_key_press,
             on_release=self._on_key_release
@@ -54,18 +63,20 @@ class SmartKeyboard(ThreadRunnable):
         if key not in self._hotkeys:
             return
         
-        if self._toggle_debounce:
-            return
-        self._toggle_debounce = True
-        self._current_hotkey = key
+        with self._debounce_lock:
+            if self._toggle_debounce:
+                return
+            self._toggle_debounce = True
+            self._current_hotkey = key
 
         emitter.emit(DeviceKeyboardPressEvent(hotkey=self.key_to_str(key)))
 
     def _on_key_release(self, key):
         # logger.debug(f'Release {key}')
-        if key == self._current_hotkey:
-            self._toggle_debounce = False
-            self._current_hotkey = None
+        with self._debounce_lock:
+            if key == self._current_hotkey:
+                self._toggle_debounce = False
+                self._current_hotkey = None
     
     def name(self):
         return "SmartKeyboard"
@@ -83,17 +94,16 @@ class SmartKeyboard(ThreadRunnable):
         # if s.lower().startswith("key."):
         #     s = s.split(".", 1)[1].strip()
 
-        name = s.lower()
-
-        if name in Key.__members__:
-            return Key[name]
+        k = _KEY_NAME_MAP.get(s.lower())
+        if k is not None:
+            return k
 
         if len(s) == 1:
             return KeyCode.from_char(s)
 
         raise ValueError(
             f"Unknown key: {s!r}. "
-            f"Try one of Key names like: {', '.join(list(Key.__members__.keys())[:20])} ..."
+            f"Try one of Key names like: {_KEY_NAME_HINT} ..."
         )
     
     @staticmethod
@@ -1,6 +1,4 @@
-import io
 import threading
-import wave
 
 import pyaudio
 import webrtcvad
@@ -8,6 +6,7 @@ from loguru import logger
 
 from common.concurrent.abs_runnable import ThreadRunnable
 from common.io.file_type import AudioFileType
+from common.utils.wav_util import make_wav_header_template, fill_wav_header
 from event.event_data import DeviceMicrophoneVADEvent
 from event.event_emitter import emitter
 
@@ -28,10 +27,15 @@ class SmartMicrophone(ThreadRunnable):
         self._format = pyaudio.paInt16
         self._channels = 1
         self._sample_rate = 16000
-        self._chunk_size = int(self._sample_rate * frame_duration / 1000)  # Bytes
+        self._chunk_size = int(self._sample_rate * frame_duration / 1000)  # Frames (samples per channel)
 
         # Initialize microphone
         self._audio = pyaudio.PyAudio()
+        self._sample_width = self._audio.get_sample_size(self._format)
+        self._frame_bytes = self._chunk_size * self._sample_width * self._channels  # Bytes of one VAD frame
+
+        # 音频格式在麦克风生命周期内不变, 预先生成 44 字节的 WAV 头, 两个长度字段在发送时再填入
+        self._wav_header_template = make_wav_header_template(self._channels, self._sample_rate, self._sample_width)
         self._vad = webrtcvad.Vad(vad_mode)
         self._stream = self._audio.open(format=self._format,
                                         channels=self._channels,
@@ -39,7 +43,10 @@ class SmartMicrophone(ThreadRunnable):
                                         input=True,
                                         frames_per_buffer=self._chunk_size)
 
-        self._audio_frames = []
+        # 预分配的录音缓冲区, 复用同一块内存; 超过 30 s 的上限后才释放
+        self._max_utterance_bytes = self._sample_rate * self._sample_width * self._channels * 30  # 30 s
+        self._audio_frames = bytearray()
+        self._audio_len = 0
         self._is_speaking = False
 
         # self._pause_event = threading.Event()
@@ -74,11 +81,15 @@ class SmartMicrophone(ThreadRunnable):
                 if self._stop_flag:
                     break
 
-                data = self._stream.read(self._chunk_size, exception_on_overflow=False)
+                # 一次读出 PyAudio 已缓冲的全部整帧, 减少每 30 ms 一次的 Python 往返
+                avail = self._stream.get_read_available()
+                n = max(1, avail // self._chunk_size)
+                data = self._stream.read(n * self._chunk_size, exception_on_overflow=False)
 
                 # 锁防止 hotkey 线程强制释放时同时读取
-                with self._recording_lock:
-                    self._vad_record(data)
+                with self._recording_lock, memoryview(data) as view:
+                    for i in range(0, len(view), self._frame_bytes):
+                        self._vad_record(view[i:i + self._frame_bytes])
 
         except Exception as e:
             logger.exception(e)
@@ -88,39 +99,42 @@ class SmartMicrophone(ThreadRunnable):
             self._stream.close()
             self._audio.terminate()
 
-    def _vad_record(self, data: bytes):
+    def _vad_record(self, data: bytes | memoryview):
         if self._enable_vad:
             if self._vad.is_speech(data, self._sample_rate):
                 if not self._is_speaking:
                     logger.info("Voice detected: Beginning.")
                     self._is_speaking = True
-                self._audio_frames.append(data)
+                self._append_audio(data)
             else:
                 if self._is_speaking:
                     logger.info("Voice detected: Ending.")
                     self._is_speaking = False
                     self._emit_event()
-                    self._audio_frames = []
+                    self._reset_audio()
         else:
             if not self._is_speaking:
                 self._is_speaking = True
-            self._audio_frames.append(data)
+            self._append_audio(data)
+
+    def _append_audio(self, data: bytes | memoryview):
+        end = self._audio_len + len(data)
+        # 切片赋值: 缓冲区内原地覆盖, 超出部分自动扩展
+        self._audio_frames[self._audio_len:end] = data
+        self._audio_len = end
+
+    def _reset_audio(self):
+        self._audio_len = 0
+        if len(self._audio_frames) > self._max_utterance_bytes:
+            self._audio_frames = bytearray()
 
     def _emit_event(self):
-        if self._audio_frames:
-            # 创建一个BytesIO对象来存储WAV文件
-            file = io.BytesIO()
-            wf = wave.open(file, 'wb')
-            wf.setnchannels(self._channels)
-            wf.setsampwidth(self._audio.get_sample_size(self._format))
-            wf.setframerate(self._sample_rate)
-            wf.writeframes(b''.join(self._audio_frames))
-            wf.close()
-
-            # 将BytesIO对象的指针移到开始位置
-            file.seek(0)
+        if self._audio_len:
+            with memoryview(self._audio_frames) as view:
+                payload = view[:self._audio_len].tobytes()
             emitter.emit(DeviceMicrophoneVADEvent(
-                speech=file.read(),
+                speech=fill_wav_header(self._wav_header_template, len(payload)) + payload,
+                raw_pcm=payload,
                 audio_type=AudioFileType.WAV,
                 channels=self._channels,
                 sample_rate=self._sample_rate,
@@ -166,20 +180,21 @@ class SmartMicrophone(ThreadRunnable):
 
     def force_commit(self, is_emit=False):
         with self._recording_lock:
-            if self._is_speaking and self._audio_frames and is_emit:
+            if self._is_speaking and self._audio_len and is_emit:
                 self._is_speaking = False
                 self._emit_event()
             self._is_speaking = False
-            self._audio_frames = []
+            self._reset_audio()
 
 """
 # 备份代码，以免 self._vad 作用不佳，作用于 bot.py - on_service_vad_speech_chunk 函数中
 # 检查音频数据是否超过最低响度阈值
 # threshold: 响度阈值, 一般安静房间的 RMS 可能在 100 以下, 正常说话在 1000-5000 左右
 import numpy as np
+from common.utils.audio_dsp import rms_int16
 threshold: float = 2200.0
 audio_array = np.frombuffer(speech, dtype=np.int16)
-rms = np.sqrt(np.mean(audio_array.astype(np.float32)**2))
+rms = rms_int16(audio_array)
 logger.info(f'Microphone Voice: {rms}.')
 if rms < threshold:
     logger.debug(f'Microphone Voice too low to be accepted, already been filtered.')
@@ -1,7 +1,9 @@
 import platform
+import threading
 from pathlib import Path
 from typing import Tuple, Optional
 
+import PIL.Image
 import pyautogui
 import pygetwindow as gw
 from PIL.Image import Image
@@ -11,6 +13,12 @@ from pygetwindow import Win32Window
 from common.io.file_sys import fs
 from devices.screen.base_screen import BaseScreen
 
+try:
+    # mss is a thin BitBlt wrapper, several times faster than pyautogui's ImageGrab for region capture
+    import mss
+except ImportError:
+    mss = None
+
 
 class WindowsScreen(BaseScreen):
 
@@ -20,6 +28,8 @@ class WindowsScreen(BaseScreen):
             raise NotImplementedError("Only support Windows platform.")
         assert hasattr(pyautogui, "screenshot")
         # Note: If you have a problem that the screenshot cannot be found, try updating the `pyautogui` library
+        # mss instances hold GDI handles that must not be shared across threads, so keep one per thread
+        self._local = threading.local()
 
     def safe_capture(self, win_title: str = None, k: float | None = None) -> Tuple[Optional[Image], Optional[Path]]:
         try:
@@ -54,18 +64,36 @@ class WindowsScreen(BaseScreen):
         w.activate()
         return self._capture(w, k)
 
+    def _get_sct(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+        return sct
+
     def _capture(self, w: Win32Window, k: float | None = None) -> Tuple[Image, Path]:
 
         if k is None:
+            bbox = None
+        else:
+            half_w, half_h = k * w.width / 2, k * w.height / 2
+            bbox = tuple(max(int(num), 0) for num in (w.centerx - half_w, w.centery - half_h,
+                                                      w.centerx + half_w, w.centery + half_h))
+
+        if mss is not None:
+            sct = self._get_sct()
+            raw = sct.grab(sct.monitors[1] if bbox is None else bbox)
+            # Decode BGRA into RGB in a single pass, without an intermediate RGBA image
+            img = PIL.Image.frombytes("RGB", raw.size, raw.bgra, "raw", "BGRX")
+        elif bbox is None:
             img = pyautogui.screenshot()
         else:
-            region = (
-                w.centerx - k * w.width / 2, w.centery - k * w.height / 2, w.centerx + k * w.width / 2,
-                w.centery + k * w.height / 2)
-            region = tuple(int(num) if num > 0 else 0 for num in region)
-            img = pyautogui.screenshot(region=region)  # noqa
+            left, top, right, bottom = bbox
+            # Note: pyautogui takes (left, top, width, height)
+            img = pyautogui.screenshot(region=(left, top, right - left, bottom - top))  # noqa
 
         img_save_path = fs.create_temp_file_descriptor(prefix="screenshot", suffix=".png", type="image")
-        img.save(img_save_path)
+        # Low compression level: the file is only a temp handoff to OCR/ImgCap, zlib effort is wasted here
+        img.save(img_save_path, format="PNG", compress_level=1)
 
         return img, img_save_path
@@ -86,6 +86,7 @@ class DeviceKeyboardPressEvent(BaseEvent):
 
 class DeviceMicrophoneVADEvent(BaseEvent):
     speech: bytes
+    raw_pcm: bytes | None = None  # 16-bit PCM without WAV header, lets ASR build the container only once
     audio_type: AudioFileType
     channels: int
     sample_rate: int
@@ -28,9 +28,9 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List
 
 from loguru import logger
-from typeguard import typechecked
 
 from common.concurrent.killable_thread import KillableThread
+from common.utils.type_util import typechecked
 from event.event_data import BaseEvent
 
 
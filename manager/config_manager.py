@@ -3,9 +3,9 @@ from pathlib import Path
 
 import yaml
 from loguru import logger
-from typeguard import typechecked
 
 from common.generator.config_gen import ConfigFileGenerator
+from common.utils.type_util import typechecked
 from config import ZerolanLiveRobotConfig
 
 # Should not import these global value!
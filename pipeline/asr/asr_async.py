@@ -2,10 +2,10 @@ import os
 from typing import Dict, BinaryIO, Generator
 
 from loguru import logger
-from typeguard import typechecked
 from zerolan.data.pipeline.abs_data import AbstractModelQuery
 from zerolan.data.pipeline.asr import ASRQuery, ASRPrediction, ASRStreamQuery
 
+from common.utils.type_util import typechecked
 from pipeline.asr.config import ASRPipelineConfig, ASRModelIdEnum
 from pipeline.base.base_async import BaseAsyncPipeline, stream_generator, get_base_url
 
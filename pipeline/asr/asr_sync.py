@@ -1,10 +1,9 @@
 import os.path
 from typing import Tuple, Generator
 
-import requests
-from typeguard import typechecked
 from zerolan.data.pipeline.asr import ASRQuery, ASRPrediction, ASRStreamQuery
 
+from common.utils.type_util import typechecked
 from pipeline.asr.baidu_asr import BaiduASRPipeline
 from pipeline.asr.whisper_asr import WhisperASRPipeline
 from pipeline.asr.config import ASRPipelineConfig, ASRModelIdEnum
@@ -15,6 +14,8 @@ class ASRSyncPipeline(CommonModelPipeline):
 
     def __init__(self, config: ASRPipelineConfig):
         super().__init__(config)
+        # Whether `stream_predict` accepts headerless PCM (media type `raw`) directly
+        self.supports_raw_pcm = False
         if config.model_id == ASRModelIdEnum.BaiduASR and config.baidu_asr_config is not None:
             baidu = BaiduASRPipeline(api_key=config.baidu_asr_config.api_key,
                                      secret_key=config.baidu_asr_config.secret_key)
@@ -32,12 +33,13 @@ class ASRSyncPipeline(CommonModelPipeline):
             )
             self.predict = whisper.predict
             self.stream_predict = whisper.stream_predict
+            self.supports_raw_pcm = True
 
     @typechecked
     def predict(self, query: ASRQuery) -> ASRPrediction | None:
         assert isinstance(query, ASRQuery)
         files, data = self.parse_query(query)
-        response = requests.post(url=self.predict_url, files=files, data=data)
+        response = self._session.post(url=self.predict_url, files=files, data=data)
 
         response.raise_for_status()
         prediction = self.parse_prediction(response.content)
@@ -48,7 +50,7 @@ class ASRSyncPipeline(CommonModelPipeline):
         ASRPrediction, None, None]:
         assert isinstance(query, ASRStreamQuery)
         files, data = self.parse_query(query)
-        response = requests.post(url=self.stream_predict_url, files=files, data=data)
+        response = self._session.post(url=self.stream_predict_url, files=files, data=data)
         response.raise_for_status()
 
         for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=True):
@@ -9,11 +9,11 @@ import librosa
 import requests
 import soundfile as sf
 from pydantic import BaseModel
-from typeguard import typechecked
 from zerolan.data.pipeline.asr import ASRQuery, ASRPrediction, ASRStreamQuery
 
 from common.io.api import save_audio
 from common.io.file_type import AudioFileType
+from common.utils.type_util import typechecked
 
 
 class BaiduTTSResponse(BaseModel):
@@ -47,7 +47,7 @@ class BaiduASRPipeline:
                 data = f.read()
 
         data_len = len(data)
-        audio_base64 = base64.b64encode(data).decode('utf-8')
+        audio_base64 = base64.b64encode(data).decode('ascii')
 
         payload = json.dumps({
             "format": query.media_type,
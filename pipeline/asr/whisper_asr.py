@@ -1,12 +1,64 @@
 import os.path
-from typing import Generator
+from typing import Generator, BinaryIO
 
 import requests
-from typeguard import typechecked
+from requests.adapters import HTTPAdapter
 from zerolan.data.pipeline.asr import ASRQuery, ASRPrediction, ASRStreamQuery
 
-from common.io.api import save_audio
 from common.io.file_type import AudioFileType
+from common.utils.type_util import typechecked
+from common.utils.wav_util import make_wav_header_template, fill_wav_header
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+# Map media type to MIME content type
+_CONTENT_TYPE = {
+    "wav": "audio/wav",
+    "mp3": "audio/mpeg",
+    "mp4": "audio/mp4",
+    "mpeg": "audio/mpeg",
+    "mpga": "audio/mpeg",
+    "m4a": "audio/mp4",
+    "ogg": "audio/ogg",
+    "webm": "audio/webm",
+    "flac": "audio/flac"
+}
+
+
+class _ChainedReader:
+    """
+    Read-only file-like object over several bytes-like parts, e.g. a WAV header and the raw PCM payload,
+    so that they can be uploaded back to back without concatenating them first.
+    """
+
+    def __init__(self, *parts: bytes):
+        self._parts = [memoryview(part) for part in parts if len(part) > 0]
+        self._remaining = sum(len(part) for part in self._parts)
+
+    @property
+    def len(self) -> int:
+        # Remaining bytes, the protocol `requests` and `requests_toolbelt` use to size file-like bodies
+        return self._remaining
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._remaining
+        chunks = []
+        while size > 0 and self._parts:
+            part = self._parts[0]
+            chunk = part[:size]
+            chunks.append(chunk)
+            size -= len(chunk)
+            self._remaining -= len(chunk)
+            if len(chunk) == len(part):
+                self._parts.pop(0)
+            else:
+                self._parts[0] = part[len(chunk):]
+        return b''.join(chunks)
 
 
 class WhisperASRPipeline:
@@ -32,6 +84,17 @@ class WhisperASRPipeline:
         self._temperature = temperature
         self._response_format = response_format
 
+        # Reuse a keep-alive connection, so that each call does not pay for DNS + TCP + TLS handshake again
+        self._session = requests.Session()
+        self._session.headers['Authorization'] = f'Bearer {api_key}'
+        self._session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+    def close(self):
+        """
+        Release the pooled connections.
+        """
+        self._session.close()
+
     @typechecked
     def predict(self, query: ASRQuery) -> ASRPrediction:
         """
@@ -42,6 +105,19 @@ class WhisperASRPipeline:
         assert os.path.exists(query.audio_path), f"{query.audio_path} does not exist!"
         assert self._api_key is not None and self._api_key != "", "API key must be provided!"
 
+        # Open file and prepare for multipart upload
+        with open(query.audio_path, 'rb') as audio_file:
+            return self._transcribe(os.path.basename(query.audio_path), audio_file,
+                                    self._get_content_type(query.media_type))
+
+    def _transcribe(self, file_name: str, audio_file: BinaryIO | _ChainedReader, content_type: str) -> ASRPrediction:
+        """
+        Upload the audio to Whisper API and parse the transcript.
+        :param file_name: File name reported in the multipart upload.
+        :param audio_file: Readable binary file-like object of the audio.
+        :param content_type: MIME content type of the audio.
+        :return: ASR prediction with transcript.
+        """
         # Prepare multipart/form-data
         data = {
             'model': self._model,
@@ -57,23 +133,26 @@ class WhisperASRPipeline:
         if self._response_format != "json":
             data['response_format'] = self._response_format
         
-        headers = {
-            'Authorization': f'Bearer {self._api_key}'
-        }
-        
-        # Open file and prepare for multipart upload
-        with open(query.audio_path, 'rb') as audio_file:
+        if TOOLBELT_AVAILABLE:
+            # Stream the multipart body from the file object instead of building it in memory
+            data['file'] = (file_name, audio_file, content_type)
+            encoder = MultipartEncoder(fields=data)
+            response = self._session.post(
+                url=self._api_url,
+                data=encoder,
+                headers={'Content-Type': encoder.content_type}
+            )
+        else:
             files = {
-                'file': (os.path.basename(query.audio_path), audio_file, self._get_content_type(query.media_type))
+                'file': (file_name, audio_file, content_type)
             }
-            
-            response = requests.post(
+
+            response = self._session.post(
                 url=self._api_url,
                 files=files,
-                data=data,
-                headers=headers
+                data=data
             )
-        
+
         response.raise_for_status()
         
         # Parse response based on format
@@ -99,35 +178,29 @@ class WhisperASRPipeline:
         ASRPrediction, None, None]:
         """
         Stream predict is not directly supported by Whisper API.
-        We convert stream query to regular query by saving audio to temp file.
+        We upload the in-memory audio data as a whole, without writing a temp file.
+        Raw 16-bit PCM (media type `raw`) is wrapped in a WAV header right here, so it is containerized only once.
         :param query: ASR stream query containing audio data.
         :param chunk_size: Not used for Whisper API.
         :return: Generator yielding ASR prediction.
         """
-        audio_path = save_audio(query.audio_data, AudioFileType.WAV, prefix="asr")
-        yield self.predict(ASRQuery(
-            audio_path=str(audio_path),
-            media_type=query.media_type,
-            sample_rate=query.sample_rate,
-            channels=query.channels,
-        ))
+        assert self._api_key is not None and self._api_key != "", "API key must be provided!"
+
+        if query.media_type == AudioFileType.RAW.value:
+            header = fill_wav_header(make_wav_header_template(query.channels, query.sample_rate),
+                                     len(query.audio_data))
+            yield self._transcribe("speech.wav", _ChainedReader(header, query.audio_data), "audio/wav")
+        else:
+            yield self._transcribe(f"speech.{query.media_type}", _ChainedReader(query.audio_data),
+                                   self._get_content_type(query.media_type))
 
     @staticmethod
-    def _get_content_type(media_type: str) -> str:
+    def _get_content_type(media_type: str | AudioFileType) -> str:
         """
         Map media type to MIME content type.
         :param media_type: Audio file format (wav, mp3, etc.)
         :return: MIME content type
         """
-        type_map = {
-            "wav": "audio/wav",
-            "mp3": "audio/mpeg",
-            "mp4": "audio/mp4",
-            "mpeg": "audio/mpeg",
-            "mpga": "audio/mpeg",
-            "m4a": "audio/mp4",
-            "ogg": "audio/ogg",
-            "webm": "audio/webm",
-            "flac": "audio/flac"
-        }
-        return type_map.get(media_type.lower(), "audio/wav")
+        if isinstance(media_type, AudioFileType):
+            media_type = media_type.value
+        return _CONTENT_TYPE.get(media_type, "audio/wav")
@@ -1,12 +1,14 @@
+import asyncio
 import os
-from typing import Dict, Any, Generator
+from typing import Dict, Any, Generator, List
 
 import aiohttp
 import urllib3.util
 from aiohttp import ClientResponse
-from typeguard import typechecked
 from zerolan.data.pipeline.abs_data import AbsractImageModelQuery
 
+from common.utils.type_util import typechecked
+
 
 @typechecked
 def get_base_url(url: str) -> str:
@@ -36,6 +38,14 @@ class BaseAsyncPipeline:
     async def close(self):
         await self._dispose_client_session()
 
+    async def predict_batch(self, queries: List[Any]) -> List[Any]:
+        """
+        Predict several queries concurrently, the requests share the pipeline's connection pool.
+        :param queries: List of queries accepted by `predict`.
+        :return: List of predictions, in the same order as the queries.
+        """
+        return list(await asyncio.gather(*[self.predict(query) for query in queries]))
+
 
 @typechecked
 def _parse_imgcap_query(query: AbsractImageModelQuery) -> Dict[str, Any]:
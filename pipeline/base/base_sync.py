@@ -1,12 +1,18 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Tuple, Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Generator, List
 
 import requests
 from pydantic import BaseModel, Field
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from zerolan.data.pipeline.abs_data import AbsractImageModelQuery, AbstractModelQuery, AbstractModelPrediction
 
+# Upper bound of concurrent requests for a sync `predict_batch`
+_BATCH_MAX_WORKERS = 8
+
 
 class AbstractPipelineConfig(BaseModel):
     enable: bool = Field(True, description="Whether the pipeline is enabled.")
@@ -63,6 +69,13 @@ class CommonModelPipeline(PredictablePipeline):
 
     def __init__(self, config: AbstractPipelineConfig):
         super().__init__(config)
+        # Keep connections to the model server alive between predictions instead of reconnecting every time.
+        # Retry only covers connection failures here, POST requests are not resent after they reach the server.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                              max_retries=Retry(total=2, backoff_factor=0.1))
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
 
     def predict(self, query: AbstractModelQuery) -> AbstractModelPrediction | None:
         """
@@ -72,7 +85,7 @@ class CommonModelPipeline(PredictablePipeline):
         :return: An instance of prediction. Depend on your model pipeline definition. Raise exception if any error happened.
         """
         query_dict = self.parse_query(query)
-        response = requests.post(url=self.predict_url, stream=False, json=query_dict)
+        response = self._session.post(url=self.predict_url, stream=False, json=query_dict)
         response.raise_for_status()
         prediction = self.parse_prediction(response)
         return prediction
@@ -87,7 +100,7 @@ class CommonModelPipeline(PredictablePipeline):
         :return: An instance of generator for providing streamed prediction. Depend on your model pipeline definition. Raise exception if any error happened.
         """
         query_dict = self.parse_query(query)
-        response = requests.post(url=self.stream_predict_url, stream=True, json=query_dict)
+        response = self._session.post(url=self.stream_predict_url, stream=True, json=query_dict)
         response.raise_for_status()
 
         for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=True):
@@ -115,6 +128,18 @@ class AbstractImagePipeline(CommonModelPipeline):
     def __init__(self, config: any):
         super().__init__(config)
 
+    def predict_batch(self, queries: List[AbsractImageModelQuery]) -> List[AbstractModelPrediction | None]:
+        """
+        Predict several images concurrently, the requests share the pipeline's connection pool.
+        Note: This is a sync method so it will block your program.
+        :param queries: List of image queries.
+        :return: List of predictions, in the same order as the queries.
+        """
+        if len(queries) <= 1:
+            return [self.predict(query) for query in queries]
+        with ThreadPoolExecutor(max_workers=min(len(queries), _BATCH_MAX_WORKERS)) as executor:
+            return list(executor.map(self.predict, queries))
+
     def predict(self, query: AbsractImageModelQuery) -> AbstractModelPrediction | None:
         response = self._predict(query)
         prediction = self.parse_prediction(response)
@@ -131,10 +156,10 @@ class AbstractImagePipeline(CommonModelPipeline):
         parsed_query = self.parse_query(query)
         response = None
         if isinstance(parsed_query, dict):
-            response = requests.post(url=self.predict_url, json=query.model_dump())
+            response = self._session.post(url=self.predict_url, json=query.model_dump())
         elif isinstance(parsed_query, tuple):
             files, data = parsed_query[0], parsed_query[1]
-            response = requests.post(url=self.predict_url, files=files, data=data)
+            response = self._session.post(url=self.predict_url, files=files, data=data)
             del files, data
 
         assert response is not None, "No response got, please check `parse_query`."
@@ -0,0 +1,213 @@
+import asyncio
+import os
+import threading
+import weakref
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Generator, AsyncGenerator
+
+import httpx
+from openai import OpenAI, AsyncOpenAI, DEFAULT_TIMEOUT
+
+from common.utils.img_util import image_file_to_data_url
+
+# HTTP/2 needs the optional `h2` package, fall back to HTTP/1.1 keep-alive without it
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Async clients are bound to the event loop their connections were opened on, so they are kept per loop.
+# Their pooled connections reference the loop and keep the entry alive, so they are not dropped with the loop:
+# call `aclose_async_clients` before the loop is closed (e.g. `asyncio.run` restarts, function-scoped pytest loops)
+_shared_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+    weakref.WeakKeyDictionary()
+_async_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], AsyncOpenAI]]" = \
+    weakref.WeakKeyDictionary()
+
+# Short timeout for the warm-up request, it must never hold up real traffic
+_WARM_UP_TIMEOUT = 5.0
+
+
+def get_shared_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the httpx.AsyncClient of the running event loop used by the OpenAI-compatible async pipelines.
+    Sharing one connection pool lets OCR, ImgCap and VidCap requests reuse TCP/TLS connections
+    and run concurrently instead of each pipeline holding its own pool.
+    Must be called inside a running event loop.
+    :return: Shared async HTTP client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_async_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            http2=_HTTP2_AVAILABLE,
+            # Same as the SDK default (600 s read, 5 s connect), a non-streamed VidCap completion can take minutes
+            timeout=DEFAULT_TIMEOUT,
+        )
+        _shared_async_http_clients[loop] = client
+        # The AsyncOpenAI clients wrap the old HTTP client, they must be recreated as well
+        _async_openai_clients.pop(loop, None)
+    return client
+
+
+async def aclose_async_clients():
+    """
+    Close the shared HTTP client of the running event loop and drop its AsyncOpenAI clients.
+    Pipelines used again on this loop will open a new connection pool.
+    """
+    loop = asyncio.get_running_loop()
+    _async_openai_clients.pop(loop, None)
+    client = _shared_async_http_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def _warm_up_sync(client: OpenAI):
+    try:
+        client.with_options(timeout=_WARM_UP_TIMEOUT, max_retries=0).models.list()
+    except Exception:
+        # Not every OpenAI-compatible service supports listing models, the handshake is all we need
+        pass
+
+
+def warm_up_openai_client(client: OpenAI):
+    """
+    Open a connection to the OpenAI-compatible endpoint on a background thread,
+    so that the first real request does not pay for DNS + TCP + TLS handshake. Errors are ignored.
+    Async clients are not warmed up: they are created outside any event loop, and a connection
+    opened on one loop cannot be reused by another.
+    :param client: The client whose connection pool should be warmed up.
+    """
+    threading.Thread(target=_warm_up_sync, args=(client,), daemon=True).start()
+
+
+@lru_cache(maxsize=8)
+def get_openai_client(api_key: str, base_url: str) -> OpenAI:
+    """
+    Get the process-wide OpenAI client for an endpoint.
+    OCR, ImgCap and VidCap pipelines targeting the same endpoint share one client and thus one connection pool.
+    :param api_key: API key of the OpenAI-compatible service.
+    :param base_url: Normalized base URL of the OpenAI-compatible service.
+    :return: Shared OpenAI client.
+    """
+    client = OpenAI(api_key=api_key, base_url=base_url)
+    warm_up_openai_client(client)
+    return client
+
+
+def get_async_openai_client(api_key: str, base_url: str) -> AsyncOpenAI:
+    """
+    Get the AsyncOpenAI client of the running event loop for an endpoint, backed by `get_shared_async_http_client`.
+    Must be called inside a running event loop, i.e. when a request is made rather than at pipeline construction.
+    :param api_key: API key of the OpenAI-compatible service.
+    :param base_url: Normalized base URL of the OpenAI-compatible service.
+    :return: Shared AsyncOpenAI client.
+    """
+    http_client = get_shared_async_http_client()
+    clients = _async_openai_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get((api_key, base_url))
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+        clients[(api_key, base_url)] = client
+    return client
+
+
+class AsyncOpenAIClientMixin:
+    """
+    Mixin for OpenAI-compatible pipelines backed by AsyncOpenAI, put it before the sync pipeline in the bases.
+    Requests go through the shared async connection pool, so OCR, ImgCap and VidCap requests can overlap.
+    """
+    _api_key: str
+    _base_url: str
+
+    def _create_client(self):
+        # The AsyncOpenAI client depends on the running event loop, see `_async_client`
+        return None
+
+    @property
+    def _async_client(self) -> AsyncOpenAI:
+        return get_async_openai_client(self._api_key, self._base_url)
+
+
+class ImageMessagesMixin:
+    """
+    Builds the chat messages of the single-image OpenAI-compatible pipelines from `_PROMPT_PART` and the query image.
+    """
+    _PROMPT_PART: dict
+    _api_key: str
+
+    def _build_messages(self, query) -> list:
+        assert os.path.exists(query.img_path), f"{query.img_path} does not exist!"
+        assert self._api_key is not None and self._api_key != "", "API key must be provided!"
+
+        # Read and encode image to base64, cached by file identity and mtime
+        image_url = image_file_to_data_url(query.img_path)
+
+        # Prepare messages for vision model, only the image part changes between calls
+        return [
+            {
+                "role": "user",
+                "content": [
+                    self._PROMPT_PART,
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": image_url
+                        }
+                    }
+                ]
+            }
+        ]
+
+
+def stream_chat_completion(client: OpenAI, model: str, messages: list,
+                           max_tokens: int) -> Generator[str, None, None]:
+    """
+    Stream a chat completion.
+    :param client: OpenAI client.
+    :param model: Model name.
+    :param messages: Messages for the chat completion.
+    :param max_tokens: Maximum number of tokens to generate.
+    :return: Generator yielding the text generated so far, once per non-empty delta, or "" once if there is none.
+    """
+    stream = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    text = ""
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            text += delta
+            yield text
+    if not text:
+        # Always yield once, even if the model returned no content
+        yield text
+
+
+async def astream_chat_completion(client: AsyncOpenAI, model: str, messages: list,
+                                  max_tokens: int) -> AsyncGenerator[str, None]:
+    """
+    Stream a chat completion with an async client, see `stream_chat_completion`.
+    :return: Async generator yielding the text generated so far, once per non-empty delta, or "" once if there is none.
+    """
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=messages,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    text = ""
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            text += delta
+            yield text
+    if not text:
+        # Always yield once, even if the model returned no content
+        yield text
@@ -1,6 +1,6 @@
-from typeguard import typechecked
 from zerolan.data.pipeline.milvus import MilvusQuery, MilvusQueryResult, MilvusInsert, MilvusInsertResult
 
+from common.utils.type_util import typechecked
 from pipeline.base.base_async import BaseAsyncPipeline, get_base_url
 from pipeline.db.milvus.milvus_sync import MilvusDatabaseConfig
 
@@ -14,6 +14,9 @@ class ImgCapModelIdEnum(BaseEnum):
     OtherOpenAIFormat = 'Other-OpenAI-Format'
 
 
+_MODEL_ID_DESC = f"The ID of the model used for image captioning. \n{enum_to_markdown(ImgCapModelIdEnum)}"
+
+
 class OpenAIFormatConfig(BaseModel):
     api_key: str = Field(default="", description="The API key for OpenAI-compatible API service.")
     base_url: str = Field(default="https://api.openai.com/v1",
@@ -24,9 +27,7 @@ class OpenAIFormatConfig(BaseModel):
 
 
 class ImgCapPipelineConfig(AbstractPipelineConfig):
-    model_id: ImgCapModelIdEnum = Field(default=ImgCapModelIdEnum.Blip,
-                                        description=f"The ID of the model used for image captioning. "
-                                                    f"\n{enum_to_markdown(ImgCapModelIdEnum)}")
+    model_id: ImgCapModelIdEnum = Field(default=ImgCapModelIdEnum.Blip, description=_MODEL_ID_DESC)
     predict_url: str = Field(default="http://127.0.0.1:11000/img-cap/predict",
                              description="The URL for image captioning prediction requests.")
     stream_predict_url: str = Field(default="http://127.0.0.1:11000/img-cap/stream-predict",
@@ -1,6 +1,8 @@
 from requests import Response
 from zerolan.data.pipeline.img_cap import ImgCapQuery, ImgCapPrediction
 
+from common.utils.json_util import fast_json_loads
+from common.utils.type_util import TYPECHECK
 from pipeline.base.base_sync import AbstractImagePipeline
 from pipeline.imgcap.config import ImgCapPipelineConfig, ImgCapModelIdEnum
 from pipeline.imgcap.openai_imgcap import OpenAIImgCapPipeline
@@ -29,4 +31,7 @@ class ImgCapSyncPipeline(AbstractImagePipeline):
 
     def parse_prediction(self, response: Response) -> ImgCapPrediction:
         json_val = response.content
-        return ImgCapPrediction.model_validate_json(json_val)
+        if TYPECHECK:
+            return ImgCapPrediction.model_validate_json(json_val)
+        # The response comes from our own server, skip validation
+        return ImgCapPrediction.model_construct(**fast_json_loads(json_val))
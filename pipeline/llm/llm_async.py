@@ -1,8 +1,8 @@
 from typing import Generator
 
-from typeguard import typechecked
 from zerolan.data.pipeline.llm import LLMQuery, LLMPrediction
 
+from common.utils.type_util import typechecked
 from pipeline.base.base_async import BaseAsyncPipeline, get_base_url
 from pipeline.llm.config import LLMPipelineConfig, LLMModelIdEnum
 
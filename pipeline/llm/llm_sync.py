@@ -1,8 +1,8 @@
 from openai import OpenAI
 from requests import Response
-from typeguard import typechecked
 from zerolan.data.pipeline.llm import LLMQuery, LLMPrediction, RoleEnum, Conversation
 
+from common.utils.type_util import typechecked
 from pipeline.base.base_sync import CommonModelPipeline
 from pipeline.llm.config import LLMPipelineConfig
 
@@ -1,10 +1,12 @@
 from typing import Literal
 
-from typeguard import typechecked
 from zerolan.data.pipeline.ocr import OCRQuery, OCRPrediction
 
+from common.utils.type_util import typechecked
 from pipeline.base.base_async import BaseAsyncPipeline, _parse_imgcap_query, get_base_url
+from pipeline.base.openai_client import aclose_async_clients
 from pipeline.ocr.config import OCRPipelineConfig, OCRModelIdEnum
+from pipeline.ocr.openai_ocr import OpenAIOCRAsyncPipeline
 
 
 class OCRAsyncPipeline(BaseAsyncPipeline):
@@ -13,6 +15,17 @@ class OCRAsyncPipeline(BaseAsyncPipeline):
         self._model_id: OCRModelIdEnum = config.model_id
         self._predict_endpoint = "/ocr/predict"
         self._stream_predict_endpoint = "/ocr/stream-predict"
+        self._openai_pipeline: OpenAIOCRAsyncPipeline | None = None
+        # Check if using OpenAI format
+        if config.model_id == OCRModelIdEnum.OtherOpenAIFormat and config.openai_format_config is not None:
+            self._openai_pipeline = OpenAIOCRAsyncPipeline(config.openai_format_config)
+            self.predict = self._openai_pipeline.predict
+            self.stream_predict = self._openai_pipeline.stream_predict
+
+    async def close(self):
+        if self._openai_pipeline is not None:
+            await aclose_async_clients()
+        await super().close()
 
     @typechecked
     async def predict(self, query: OCRQuery) -> OCRPrediction:
@@ -1,8 +1,10 @@
 from typing import List
 
 from requests import Response
-from zerolan.data.pipeline.ocr import OCRQuery, OCRPrediction, RegionResult
+from zerolan.data.pipeline.ocr import OCRQuery, OCRPrediction, RegionResult, Position, Vector2D
 
+from common.utils.json_util import fast_json_loads
+from common.utils.type_util import TYPECHECK
 from pipeline.base.base_sync import AbstractImagePipeline
 from pipeline.ocr.config import OCRPipelineConfig, OCRModelIdEnum
 from pipeline.ocr.openai_ocr import OpenAIOCRPipeline
@@ -31,7 +33,20 @@ class OCRSyncPipeline(AbstractImagePipeline):
 
     def parse_prediction(self, response: Response) -> OCRPrediction:
         json_val = response.content
-        return OCRPrediction.model_validate_json(json_val)
+        if TYPECHECK:
+            return OCRPrediction.model_validate_json(json_val)
+        # The response comes from our own server, skip validation
+        data = fast_json_loads(json_val)
+        data["region_results"] = [_construct_region_result(r) for r in data.get("region_results", [])]
+        return OCRPrediction.model_construct(**data)
+
+
+def _construct_region_result(data: dict) -> RegionResult:
+    position = data.get("position")
+    if position is not None:
+        data["position"] = Position.model_construct(
+            **{k: Vector2D.model_construct(**v) for k, v in position.items()})
+    return RegionResult.model_construct(**data)
 
 
 def avg_confidence(p: OCRPrediction) -> float:
@@ -1,16 +1,25 @@
-import os
-import base64
-from typing import Generator
+import asyncio
+from typing import Generator, AsyncGenerator
 
-from openai import OpenAI
-from typeguard import typechecked
 from zerolan.data.pipeline.ocr import OCRQuery, OCRPrediction, RegionResult, Position, Vector2D
 
+from common.utils.openai_url import normalize as normalize_openai_url
 from common.utils.str_util import remove_md_blocks
+from common.utils.type_util import typechecked
+from pipeline.base.openai_client import get_openai_client, stream_chat_completion, astream_chat_completion, \
+    AsyncOpenAIClientMixin, ImageMessagesMixin
 from pipeline.ocr.config import OpenAIFormatConfig
 
 
-class OpenAIOCRPipeline:
+def _line_position(idx: int) -> Position:
+    # All four corners are the same point, share one vector
+    v = Vector2D.model_construct(x=0.0, y=float(idx))
+    return Position.model_construct(lu=v, ru=v, rd=v, ld=v)
+
+
+class OpenAIOCRPipeline(ImageMessagesMixin):
+    _PROMPT = "Extract all text from this image. Return the text content in the order it appears, preserving line breaks. If there are multiple text regions, list them separately."
+    _PROMPT_PART = {"type": "text", "text": _PROMPT}
 
     def __init__(self, config: OpenAIFormatConfig):
         """
@@ -18,18 +27,11 @@ class OpenAIOCRPipeline:
         :param config: OpenAI format configuration containing api_key, base_url, model, etc.
         """
         self._api_key = config.api_key
-        self._base_url = config.base_url
+        self._base_url = normalize_openai_url(config.base_url)
         self._model = config.model
         self._max_tokens = config.max_tokens
         
-        # Ensure base_url ends with /v1 for OpenAI compatibility
-        if not self._base_url.endswith('/v1'):
-            if self._base_url.endswith('/'):
-                self._base_url = self._base_url.rstrip('/') + '/v1'
-            else:
-                self._base_url = self._base_url + '/v1'
-        
-        self._client = OpenAI(api_key=self._api_key, base_url=self._base_url)
+        self._client = self._create_client()
 
         # OpenAI doesn't provide confidence, use default
         # Warning:
@@ -37,6 +39,9 @@ class OpenAIOCRPipeline:
         #   A better method to calculate the confidence of the results from OCR may be based on ENTROPY?
         self._default_confidence = 0.95
 
+    def _create_client(self):
+        return get_openai_client(self._api_key, self._base_url)
+
     @typechecked
     def predict(self, query: OCRQuery) -> OCRPrediction:
         """
@@ -44,31 +49,7 @@ class OpenAIOCRPipeline:
         :param query: OCR query containing image path.
         :return: OCR prediction with extracted text regions.
         """
-        assert os.path.exists(query.img_path), f"{query.img_path} does not exist!"
-        assert self._api_key is not None and self._api_key != "", "API key must be provided!"
-
-        # Read and encode image to base64
-        with open(query.img_path, 'rb') as image_file:
-            base64_image = base64.b64encode(image_file.read()).decode('utf-8')
-
-        # Prepare messages for vision model
-        messages = [
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": "Extract all text from this image. Return the text content in the order it appears, preserving line breaks. If there are multiple text regions, list them separately."
-                    },
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/jpeg;base64,{base64_image}"
-                        }
-                    }
-                ]
-            }
-        ]
+        messages = self._build_messages(query)
 
         # Call OpenAI API
         completion = self._client.chat.completions.create(
@@ -77,7 +58,15 @@ class OpenAIOCRPipeline:
             max_tokens=self._max_tokens
         )
 
-        text_content = completion.choices[0].message.content
+        return self._parse_completion(completion)
+
+    def _parse_completion(self, completion) -> OCRPrediction:
+        return self._parse_text(completion.choices[0].message.content)
+
+    def _parse_text(self, text_content: str, partial: bool = False) -> OCRPrediction:
+        if partial and text_content.lstrip().startswith('```'):
+            # The closing fence has not arrived yet, drop the opening fence line
+            text_content = text_content.lstrip().partition('\n')[2]
 
         # Clean up markdown code blocks if present
         # @AkagawaTsurunaki moved the code snippets to `str_util.py`.
@@ -90,30 +79,74 @@ class OpenAIOCRPipeline:
     def stream_predict(self, query: OCRQuery, chunk_size: int | None = None) -> Generator[
             OCRPrediction, None, None]:
         """
-        Stream predict is not directly supported for OCR.
-        We convert it to regular predict.
+        Stream text extraction using OpenAI-compatible API.
+        A prediction is yielded every time new complete lines arrive, the last one contains all lines.
         :param query: OCR query containing image path.
         :param chunk_size: Not used.
         :return: Generator yielding OCR prediction.
         """
-        yield self.predict(query)
+        messages = self._build_messages(query)
+
+        text_content = ""
+        last_newline = -1
+        for text_content in stream_chat_completion(self._client, self._model, messages, self._max_tokens):
+            newline = text_content.rfind('\n')
+            if newline > last_newline:
+                last_newline = newline
+                yield self._parse_text(text_content[:newline], partial=True)
+        yield self._parse_text(text_content)
 
     def _to_pipeline_format(self, text_content: str):
-        # Since OpenAI doesn't provide bounding boxes, we create a single region result
-        region_results = []
-        if text_content and text_content.strip():
-            # Split by lines and create region results
-            lines = text_content.strip().split('\n')
-            for idx, line in enumerate(lines):
-                if line.strip():
-                    region_results.append(RegionResult(
-                        content=line.strip(),
-                        confidence=self._default_confidence,
-                        position=Position(
-                            lu=Vector2D(x=0.0, y=float(idx)),
-                            ru=Vector2D(x=0.0, y=float(idx)),
-                            rd=Vector2D(x=0.0, y=float(idx)),
-                            ld=Vector2D(x=0.0, y=float(idx)),
-                        )
-                    ))
-        return OCRPrediction(region_results=region_results)
\ No newline at end of file
+        # Since OpenAI doesn't provide bounding boxes, each non-empty line becomes a region result,
+        # positioned by its line number
+        if not text_content:
+            return OCRPrediction(region_results=[])
+        confidence = self._default_confidence
+        region_results = [
+            RegionResult.model_construct(content=line, confidence=confidence, position=_line_position(idx))
+            for idx, line in enumerate(map(str.strip, text_content.strip().splitlines()))
+            if line
+        ]
+        return OCRPrediction(region_results=region_results)
+
+
+class OpenAIOCRAsyncPipeline(AsyncOpenAIClientMixin, OpenAIOCRPipeline):
+
+    @typechecked
+    async def predict(self, query: OCRQuery) -> OCRPrediction:
+        """
+        Extract text from image using OpenAI-compatible API.
+        :param query: OCR query containing image path.
+        :return: OCR prediction with extracted text regions.
+        """
+        # Reading and encoding the image would block the event loop
+        messages = await asyncio.to_thread(self._build_messages, query)
+
+        completion = await self._async_client.chat.completions.create(
+            model=self._model,
+            messages=messages,
+            max_tokens=self._max_tokens
+        )
+
+        return self._parse_completion(completion)
+
+    async def stream_predict(self, query: OCRQuery, chunk_size: int | None = None) -> AsyncGenerator[
+            OCRPrediction, None]:
+        """
+        Stream text extraction using OpenAI-compatible API.
+        A prediction is yielded every time new complete lines arrive, the last one contains all lines.
+        :param query: OCR query containing image path.
+        :param chunk_size: Not used.
+        :return: Async generator yielding OCR prediction.
+        """
+        # Reading and encoding the image would block the event loop
+        messages = await asyncio.to_thread(self._build_messages, query)
+
+        text_content = ""
+        last_newline = -1
+        async for text_content in astream_chat_completion(self._async_client, self._model, messages, self._max_tokens):
+            newline = text_content.rfind('\n')
+            if newline > last_newline:
+                last_newline = newline
+                yield self._parse_text(text_content[:newline], partial=True)
+        yield self._parse_text(text_content)
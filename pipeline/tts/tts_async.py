@@ -2,9 +2,9 @@ import os
 import uuid
 from typing import Generator
 
-from typeguard import typechecked
 from zerolan.data.pipeline.tts import TTSQuery, TTSPrediction, TTSStreamPrediction
 
+from common.utils.type_util import typechecked
 from pipeline.base.base_async import BaseAsyncPipeline, stream_generator, get_base_url
 from pipeline.tts.config import TTSPipelineConfig, TTSModelIdEnum
 
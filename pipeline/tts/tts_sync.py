@@ -2,7 +2,6 @@ import os.path
 import uuid
 from http import HTTPStatus
 
-import requests
 from loguru import logger
 from zerolan.data.pipeline.tts import TTSQuery, TTSPrediction, TTSStreamPrediction
 
@@ -27,7 +26,7 @@ class TTSSyncPipeline(CommonModelPipeline):
         if os.path.exists(query.refer_wav_path):
             query.refer_wav_path = os.path.abspath(query.refer_wav_path).replace("\\", "/")
         query_dict = self.parse_query(query)
-        response = requests.post(url=self.predict_url, stream=True, json=query_dict)
+        response = self._session.post(url=self.predict_url, stream=True, json=query_dict)
         if response.status_code == HTTPStatus.OK:
             prediction = TTSPrediction(wave_data=response.content, audio_type=query.audio_type)
             return prediction
@@ -40,8 +39,7 @@ class TTSSyncPipeline(CommonModelPipeline):
         if os.path.exists(query.refer_wav_path):
             query.refer_wav_path = os.path.abspath(query.refer_wav_path).replace("\\", "/")
         query_dict = self.parse_query(query)
-        response = requests.post(url=self.stream_predict_url, stream=True,
-                                 json=query_dict)
+        response = self._session.post(url=self.stream_predict_url, stream=True, json=query_dict)
         response.raise_for_status()
         last = 0
         id = str(uuid.uuid4())
@@ -1,11 +1,17 @@
+import asyncio
 import os
-import base64
-from typing import Generator, List
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Generator, AsyncGenerator, Callable
 
-from openai import OpenAI
-from typeguard import typechecked
 from zerolan.data.pipeline.vid_cap import VidCapQuery, VidCapPrediction
 
+from common.utils.img_util import b64encode
+from common.utils.openai_url import normalize as normalize_openai_url
+from common.utils.type_util import typechecked
+from pipeline.base.openai_client import get_openai_client, stream_chat_completion, astream_chat_completion, \
+    AsyncOpenAIClientMixin
 from pipeline.vidcap.config import OpenAIFormatConfig
 
 try:
@@ -16,7 +22,99 @@ except ImportError:
     CV2_AVAILABLE = False
 
 
+# Vision models bill by image tiles, so frames larger than this long edge only cost tokens and latency
+_FRAME_MAX_EDGE = 768
+_JPEG_QUALITY = 80
+# Seeking restarts decoding at the previous keyframe, typical H.264 GOPs are ~250 frames.
+# Below this sampling interval the sequential grab()/retrieve() loop decodes fewer frames.
+_SEEK_MIN_FRAME_INTERVAL = 250
+
+
+def _encode_frame(frame: "np.ndarray") -> str:
+    # Downscale, encode frame as JPEG, then embed it as a base64 data URI
+    h, w = frame.shape[:2]
+    scale = _FRAME_MAX_EDGE / max(h, w)
+    if scale < 1.0:
+        frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, _JPEG_QUALITY])
+    return "data:image/jpeg;base64," + b64encode(memoryview(buffer)).decode('ascii')
+
+
+def _iter_frames(video_path: str, frames_per_second: float,
+                 lookup: Callable[[int], str | None]) -> Generator[tuple[int, "np.ndarray | str"], None, None]:
+    """
+    Extract frames from video at specified rate.
+    :param video_path: Path to video file.
+    :param frames_per_second: Number of frames to extract per second.
+    :param lookup: Returns a cached value for a frame index, such frames are yielded as is without decoding.
+    :return: Generator yielding (frame index, raw BGR frame or cached value).
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video file: {video_path}")
+
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_interval = int(fps / frames_per_second) if fps > 0 else 30
+
+        total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+        if total > 0 and fps > 0 and frame_interval >= _SEEK_MIN_FRAME_INTERVAL:
+            # Seek straight to the sampled frames instead of decoding and dropping the ones in between.
+            # A seek decodes forward from the previous keyframe, so it only pays off for sparse sampling
+            for i in range(0, total, frame_interval):
+                cached = lookup(i)
+                if cached is not None:
+                    yield i, cached
+                    continue
+                if not cap.set(cv2.CAP_PROP_POS_FRAMES, i):
+                    # Backend cannot seek by frame index, try by timestamp
+                    cap.set(cv2.CAP_PROP_POS_MSEC, i * 1000.0 / fps)
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                yield i, frame
+            return
+
+        # Sampling is denser than a GOP (the common case, e.g. 1 frame per second) or the frame count is unknown,
+        # read sequentially: grab every frame, convert only the sampled ones
+        frame_count = 0
+
+        while cap.grab():
+            if frame_count % frame_interval == 0:
+                cached = lookup(frame_count)
+                if cached is not None:
+                    yield frame_count, cached
+                else:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    yield frame_count, frame
+
+            frame_count += 1
+    finally:
+        cap.release()
+
+
+def _extract_frames_impl(video_path: str, frames_per_second: float,
+                         cached_indices: frozenset) -> list[tuple[int, str | None]]:
+    """
+    Decode, downscale and encode the sampled frames of a video, meant to run in a worker process.
+    :param video_path: Path to video file.
+    :param frames_per_second: Number of frames to extract per second.
+    :param cached_indices: Frame indices the caller already has, they are skipped.
+    :return: List of (frame index, data URI), the data URI is None for skipped frames.
+    """
+    results = []
+    for i, frame in _iter_frames(video_path, frames_per_second, lambda idx: "" if idx in cached_indices else None):
+        results.append((i, None if isinstance(frame, str) else _encode_frame(frame)))
+    return results
+
+
 class OpenAIVidCapPipeline:
+    _PROMPT = "Describe this video in detail based on the extracted frames. Provide a comprehensive caption that captures the main actions, scenes, and content."
+    _PROMPT_PART = {"type": "text", "text": _PROMPT}
+    _FRAME_CACHE_SIZE = 256
 
     def __init__(self, config: OpenAIFormatConfig):
         """
@@ -24,100 +122,125 @@ class OpenAIVidCapPipeline:
         :param config: OpenAI format configuration containing api_key, base_url, model, etc.
         """
         self._api_key = config.api_key
-        self._base_url = config.base_url
+        self._base_url = normalize_openai_url(config.base_url)
         self._model = config.model
         self._max_tokens = config.max_tokens
         self._frames_per_second = config.frames_per_second
         
-        # Ensure base_url ends with /v1 for OpenAI compatibility
-        if not self._base_url.endswith('/v1'):
-            if self._base_url.endswith('/'):
-                self._base_url = self._base_url.rstrip('/') + '/v1'
-            else:
-                self._base_url = self._base_url + '/v1'
-        
-        self._client = OpenAI(api_key=self._api_key, base_url=self._base_url)
-        
+        self._client = self._create_client()
+
         if not CV2_AVAILABLE:
             raise ImportError("cv2 (OpenCV) is required for video processing. Please install it: pip install opencv-python")
 
-    def _extract_frames(self, video_path: str) -> List[bytes]:
+        self._encode_executor = self._create_encode_executor()
+        # Enough decoded frames to keep every encoder busy, without holding a whole video of raw frames
+        self._max_in_flight = 2 * (os.cpu_count() or 1)
+
+        # (video path, mtime_ns, frame index) -> frame data URI, so re-captioning a video only encodes new frames
+        self._frame_cache: OrderedDict[tuple, str] = OrderedDict()
+        self._frame_cache_lock = threading.Lock()
+
+    def _create_client(self):
+        return get_openai_client(self._api_key, self._base_url)
+
+    def _create_encode_executor(self) -> ThreadPoolExecutor | None:
+        return ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="VidCapEncode")
+
+    def close(self):
+        """
+        Shut down the frame encoding threads.
+        """
+        if self._encode_executor is not None:
+            self._encode_executor.shutdown(wait=False, cancel_futures=True)
+            self._encode_executor = None
+
+    def _frame_cache_get(self, key: tuple) -> str | None:
+        with self._frame_cache_lock:
+            value = self._frame_cache.get(key)
+            if value is not None:
+                self._frame_cache.move_to_end(key)
+            return value
+
+    def _frame_cache_put(self, key: tuple, value: str):
+        with self._frame_cache_lock:
+            self._frame_cache[key] = value
+            self._frame_cache.move_to_end(key)
+            while len(self._frame_cache) > self._FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+
+    def _frame_cache_snapshot(self, video_path: str, mtime_ns: int) -> dict[int, str]:
+        with self._frame_cache_lock:
+            return {key[2]: value for key, value in self._frame_cache.items()
+                    if key[0] == video_path and key[1] == mtime_ns}
+
+    def _extract_frames(self, video_path: str, mtime_ns: int) -> Generator[tuple[int, "np.ndarray | str"], None, None]:
         """
         Extract frames from video at specified rate.
+        Frames already in the frame cache are not decoded again.
         :param video_path: Path to video file.
-        :return: List of frame images as bytes.
+        :param mtime_ns: Modification time of the video file, part of the frame cache key.
+        :return: Generator yielding (frame index, raw BGR frame or cached data URI).
         """
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
-            raise ValueError(f"Could not open video file: {video_path}")
-        
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_interval = int(fps / self._frames_per_second) if fps > 0 else 30
-        
-        frames = []
-        frame_count = 0
-        
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            if frame_count % frame_interval == 0:
-                # Encode frame as JPEG
-                _, buffer = cv2.imencode('.jpg', frame)
-                frames.append(buffer.tobytes())
-            
-            frame_count += 1
-        
-        cap.release()
-        return frames
+        return _iter_frames(video_path, self._frames_per_second,
+                            lambda i: self._frame_cache_get((video_path, mtime_ns, i)))
 
-    @typechecked
-    def predict(self, query: VidCapQuery) -> VidCapPrediction:
+    def _build_messages(self, query: VidCapQuery) -> list | None:
         """
-        Generate video caption using OpenAI-compatible API.
+        Extract frames and build the vision messages.
         :param query: VidCap query containing video path.
-        :return: VidCap prediction with caption.
+        :return: Messages for the chat completion, or None if no frames were extracted.
         """
         assert os.path.exists(query.vid_path), f"{query.vid_path} does not exist!"
         assert self._api_key is not None and self._api_key != "", "API key must be provided!"
 
-        # Extract frames from video
-        frames = self._extract_frames(query.vid_path)
-        
-        if not frames:
-            return VidCapPrediction(caption="No frames extracted from video.")
+        mtime_ns = os.stat(query.vid_path).st_mtime_ns
 
-        # Encode frames to base64
-        base64_frames = []
-        for frame_bytes in frames:
-            base64_frame = base64.b64encode(frame_bytes).decode('utf-8')
-            base64_frames.append(base64_frame)
+        # Decode frames on this thread while the pool encodes them into data URIs,
+        # cv2.imencode releases the GIL. Results are consumed in the original frame order,
+        # and at most `_max_in_flight` raw frames are held in memory at a time.
+        content = [self._PROMPT_PART]
+        in_flight = deque()
 
-        # Prepare messages for vision model
-        content = [
-            {
-                "type": "text",
-                "text": "Describe this video in detail based on the extracted frames. Provide a comprehensive caption that captures the main actions, scenes, and content."
-            }
-        ]
-        
-        # Add frames to content (OpenAI API supports multiple images in one message)
-        for base64_frame in base64_frames:
-            content.append({
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/jpeg;base64,{base64_frame}"
-                }
-            })
-
-        messages = [
+        def drain_one():
+            key, result = in_flight.popleft()
+            if key is not None:
+                result = result.result()
+                self._frame_cache_put(key, result)
+            content.append({"type": "image_url", "image_url": {"url": result}})
+
+        for i, frame in self._extract_frames(query.vid_path, mtime_ns):
+            if isinstance(frame, str):
+                in_flight.append((None, frame))
+            else:
+                in_flight.append(((query.vid_path, mtime_ns, i), self._encode_executor.submit(_encode_frame, frame)))
+            while len(in_flight) > self._max_in_flight:
+                drain_one()
+        while in_flight:
+            drain_one()
+
+        if len(content) == 1:
+            return None
+
+        # OpenAI API supports multiple images in one message
+        return [
             {
                 "role": "user",
                 "content": content
             }
         ]
 
+    @typechecked
+    def predict(self, query: VidCapQuery) -> VidCapPrediction:
+        """
+        Generate video caption using OpenAI-compatible API.
+        :param query: VidCap query containing video path.
+        :return: VidCap prediction with caption.
+        """
+        messages = self._build_messages(query)
+
+        if messages is None:
+            return VidCapPrediction(caption="No frames extracted from video.")
+
         # Call OpenAI API
         completion = self._client.chat.completions.create(
             model=self._model,
@@ -132,10 +255,123 @@ class OpenAIVidCapPipeline:
     def stream_predict(self, query: VidCapQuery, chunk_size: int | None = None) -> Generator[
             VidCapPrediction, None, None]:
         """
-        Stream predict is not directly supported for video captioning.
-        We convert it to regular predict.
+        Stream video caption using OpenAI-compatible API.
+        Each yielded prediction contains the caption generated so far.
         :param query: VidCap query containing video path.
         :param chunk_size: Not used.
         :return: Generator yielding VidCap prediction.
         """
-        yield self.predict(query)
+        messages = self._build_messages(query)
+
+        if messages is None:
+            yield VidCapPrediction(caption="No frames extracted from video.")
+            return
+
+        for caption in stream_chat_completion(self._client, self._model, messages, self._max_tokens):
+            yield VidCapPrediction(caption=caption)
+
+
+class OpenAIVidCapAsyncPipeline(AsyncOpenAIClientMixin, OpenAIVidCapPipeline):
+
+    def __init__(self, config: OpenAIFormatConfig):
+        """
+        Initialize OpenAI-compatible Video Captioning Pipeline backed by AsyncOpenAI.
+        :param config: OpenAI format configuration containing api_key, base_url, model, etc.
+        """
+        super().__init__(config)
+        # Created on first use, worker processes stay alive between calls
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    def _create_encode_executor(self) -> ThreadPoolExecutor | None:
+        # Frames are extracted and encoded in the process pool, see `_build_messages_async`
+        return None
+
+    def close(self):
+        """
+        Shut down the frame extraction processes.
+        """
+        super().close()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=2)
+        return self._process_pool
+
+    async def _build_messages_async(self, query: VidCapQuery) -> list | None:
+        """
+        Same as `_build_messages`, but decoding and encoding run in a worker process,
+        so they neither block the event loop nor compete for the GIL.
+        :param query: VidCap query containing video path.
+        :return: Messages for the chat completion, or None if no frames were extracted.
+        """
+        assert os.path.exists(query.vid_path), f"{query.vid_path} does not exist!"
+        assert self._api_key is not None and self._api_key != "", "API key must be provided!"
+
+        mtime_ns = os.stat(query.vid_path).st_mtime_ns
+        cached = self._frame_cache_snapshot(query.vid_path, mtime_ns)
+
+        frames = await asyncio.get_running_loop().run_in_executor(
+            self._get_process_pool(), _extract_frames_impl,
+            query.vid_path, self._frames_per_second, frozenset(cached))
+
+        content = [self._PROMPT_PART]
+        for i, frame_url in frames:
+            if frame_url is None:
+                frame_url = cached[i]
+            else:
+                self._frame_cache_put((query.vid_path, mtime_ns, i), frame_url)
+            content.append({"type": "image_url", "image_url": {"url": frame_url}})
+
+        if len(content) == 1:
+            return None
+
+        return [
+            {
+                "role": "user",
+                "content": content
+            }
+        ]
+
+    @typechecked
+    async def predict(self, query: VidCapQuery) -> VidCapPrediction:
+        """
+        Generate video caption using OpenAI-compatible API.
+        :param query: VidCap query containing video path.
+        :return: VidCap prediction with caption.
+        """
+        # Frame decoding and encoding is CPU-bound, keep it off the event loop
+        messages = await self._build_messages_async(query)
+
+        if messages is None:
+            return VidCapPrediction(caption="No frames extracted from video.")
+
+        completion = await self._async_client.chat.completions.create(
+            model=self._model,
+            messages=messages,
+            max_tokens=self._max_tokens
+        )
+
+        caption = completion.choices[0].message.content
+
+        return VidCapPrediction(caption=caption)
+
+    async def stream_predict(self, query: VidCapQuery, chunk_size: int | None = None) -> AsyncGenerator[
+            VidCapPrediction, None]:
+        """
+        Stream video caption using OpenAI-compatible API.
+        Each yielded prediction contains the caption generated so far.
+        :param query: VidCap query containing video path.
+        :param chunk_size: Not used.
+        :return: Async generator yielding VidCap prediction.
+        """
+        messages = await self._build_messages_async(query)
+
+        if messages is None:
+            yield VidCapPrediction(caption="No frames extracted from video.")
+            return
+
+        async for caption in astream_chat_completion(self._async_client, self._model, messages, self._max_tokens):
+            yield VidCapPrediction(caption=caption)
@@ -1,10 +1,12 @@
 import os.path
 
-from typeguard import typechecked
 from zerolan.data.pipeline.vid_cap import VidCapQuery, VidCapPrediction
 
+from common.utils.type_util import typechecked
 from pipeline.base.base_async import BaseAsyncPipeline, get_base_url
+from pipeline.base.openai_client import aclose_async_clients
 from pipeline.vidcap.config import VidCapPipelineConfig, VidCapModelIdEnum
+from pipeline.vidcap.openai_vidcap import OpenAIVidCapAsyncPipeline
 
 
 def _parse_vid_cap_query(query: VidCapQuery):
@@ -18,6 +20,18 @@ class VidCapAsyncPipeline(BaseAsyncPipeline):
         super().__init__(base_url=get_base_url(config.predict_url))
         self._model_id: VidCapModelIdEnum = config.model_id
         self._predict_endpoint = "/vid-cap/predict"
+        self._openai_pipeline: OpenAIVidCapAsyncPipeline | None = None
+        # Check if using OpenAI format
+        if config.model_id == VidCapModelIdEnum.OtherOpenAIFormat and config.openai_format_config is not None:
+            self._openai_pipeline = OpenAIVidCapAsyncPipeline(config.openai_format_config)
+            self.predict = self._openai_pipeline.predict
+            self.stream_predict = self._openai_pipeline.stream_predict
+
+    async def close(self):
+        if self._openai_pipeline is not None:
+            self._openai_pipeline.close()
+            await aclose_async_clients()
+        await super().close()
 
     @typechecked
     async def predict(self, query: VidCapQuery) -> VidCapPrediction:
@@ -3,6 +3,8 @@ import os
 from requests import Response
 from zerolan.data.pipeline.vid_cap import VidCapQuery, VidCapPrediction
 
+from common.utils.json_util import fast_json_loads
+from common.utils.type_util import TYPECHECK
 from pipeline.base.base_sync import CommonModelPipeline
 from pipeline.vidcap.config import VidCapPipelineConfig, VidCapModelIdEnum
 from pipeline.vidcap.openai_vidcap import OpenAIVidCapPipeline
@@ -33,4 +35,7 @@ class VidCapSyncPipeline(CommonModelPipeline):
 
     def parse_prediction(self, response: Response) -> VidCapPrediction:
         json_val = response.content
-        return VidCapPrediction.model_validate(json_val)
+        if TYPECHECK:
+            return VidCapPrediction.model_validate_json(json_val)
+        # The response comes from our own server, skip validation
+        return VidCapPrediction.model_construct(**fast_json_loads(json_val))
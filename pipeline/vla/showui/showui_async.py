@@ -1,6 +1,6 @@
-from typeguard import typechecked
 from zerolan.data.pipeline.vla import ShowUiPrediction, ShowUiQuery
 
+from common.utils.type_util import typechecked
 from pipeline.base.base_async import BaseAsyncPipeline, get_base_url
 from pipeline.vla.config import VLAModelIdEnum
 from pipeline.vla.showui.config import ShowUIConfig
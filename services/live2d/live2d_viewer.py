@@ -6,10 +6,10 @@ from queue import Queue
 import live2d.v3 as live2d
 from PyQt5.QtWidgets import QApplication
 from loguru import logger
-from typeguard import typechecked
 
 from common.concurrent.abs_runnable import ThreadRunnable
 from common.concurrent.killable_thread import KillableThread
+from common.utils.type_util import typechecked
 from services.live2d.config import Live2DViewerConfig
 from services.live2d.live2d_canvas import Live2DCanvas
 
@@ -23,7 +23,7 @@ def generate_base64_secret(data: str) -> str:
     :return: Base64-encoded string
     """
     sha256_hash = hashlib.sha256(data.encode('utf-8')).digest()
-    base64_encoded_hash = base64.b64encode(sha256_hash).decode('utf-8')
+    base64_encoded_hash = base64.b64encode(sha256_hash).decode('ascii')
     return base64_encoded_hash
 
 
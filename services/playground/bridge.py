@@ -5,12 +5,12 @@ from pathlib import Path
 from typing import List
 
 from loguru import logger
-from typeguard import typechecked
 from zerolan.data.protocol.protocol import ZerolanProtocol
 
 from common.io.file_sys import fs
 from common.utils.audio_util import get_audio_real_format, get_audio_info
 from common.utils.collection_util import to_value_list
+from common.utils.type_util import typechecked
 from common.utils.web_util import get_local_ip
 from common.web.zrl_ws import ZerolanProtocolWsServer
 from event.event_data import PlaygroundConnectedEvent, PlaygroundDisconnectedEvent
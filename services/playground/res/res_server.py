@@ -7,12 +7,12 @@ from uuid import uuid4
 from flask import Flask, abort, send_file, request
 from loguru import logger
 from openai import BaseModel
-from typeguard import typechecked
 
 from common.concurrent.abs_runnable import ThreadRunnable
 from common.io.file_sys import fs
 from common.io.file_type import AudioFileType
 from common.utils.audio_util import get_audio_real_format
+from common.utils.type_util import typechecked
 from event.event_data import DeviceScreenCapturedEvent, DeviceMicrophoneVADEvent
 from event.event_emitter import emitter
 from manager.config_manager import get_config
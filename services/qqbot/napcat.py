@@ -27,8 +27,7 @@ _set_napcat_env()
 from loguru import logger
 from ncatbot.core import BotClient, GroupMessageEvent, PrivateMessageEvent
 
-from typeguard import typechecked
-
+from common.utils.type_util import typechecked
 from event.event_data import QQMessageEvent
 from event.event_emitter import emitter
 from services.qqbot.config import QQBotServiceConfig
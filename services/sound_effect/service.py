@@ -1,9 +1,16 @@
+import os
 import re
 from pathlib import Path
 from typing import List
 
 from services.sound_effect.config import SoundEffectConfig
 
+# Supported audio file extensions (in order of preference)
+_AUDIO_EXTENSIONS = ('.mp3', '.wav', '.ogg', '.m4a', '.flac')
+
+# Pattern to match JSON objects like {"sound_effect_id": "xxx"}
+_SFX_RE = re.compile(r'\{\s*"sound_effect_id"\s*:\s*"([^"]+)"\s*\}')
+
 
 class TextSegment:
     """Represents a segment of text, either plain text or a sound effect."""
@@ -26,6 +33,8 @@ class SoundEffectService:
         self._sound_effect_dir.mkdir(parents=True, exist_ok=True)
         # Cache the valid sound effect IDs
         self._valid_sound_effect_ids_cache = None
+        self._valid_sound_effect_ids_set_cache = None
+        self._sound_effect_path_cache: dict[str, Path] | None = None
 
     def get_valid_sound_effect_ids(self, ) -> List[str]:
         """
@@ -33,23 +42,29 @@ class SoundEffectService:
         :return: List of valid sound effect IDs (file names without extension)
         """
         sounds_dir = self._sound_effect_dir
-        valid_ids = []
-
-        # Supported audio file extensions
-        audio_extensions = {'.mp3', '.wav', '.ogg', '.m4a', '.flac'}
+        path_map: dict[str, Path] = {}
+        ranks: dict[str, int] = {}
 
+        # One scandir pass: DirEntry caches the file type, so no extra stat per entry
         if sounds_dir.exists():
-            for file_path in sounds_dir.iterdir():
-                if file_path.is_file():
-                    # Get file name without extension
-                    stem = file_path.stem
+            with os.scandir(sounds_dir) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    stem, ext = os.path.splitext(entry.name)
+                    ext = ext.lower()
                     # Check if it's an audio file
-                    if file_path.suffix.lower() in audio_extensions:
-                        valid_ids.append(stem)
-
+                    if ext not in _AUDIO_EXTENSIONS:
+                        continue
+                    # Keep the preferred extension if several files share the same ID
+                    rank = _AUDIO_EXTENSIONS.index(ext)
+                    if stem not in ranks or rank < ranks[stem]:
+                        ranks[stem] = rank
+                        path_map[stem] = Path(entry.path)
+
+        self._sound_effect_path_cache = path_map
         # Sort for consistency
-        valid_ids.sort()
-        return valid_ids
+        return sorted(path_map)
 
     def get_cached_valid_sound_effect_ids(self, ) -> List[str]:
         """
@@ -60,9 +75,20 @@ class SoundEffectService:
             self._valid_sound_effect_ids_cache = self.get_valid_sound_effect_ids()
         return self._valid_sound_effect_ids_cache
 
+    def get_cached_valid_sound_effect_ids_set(self, ) -> frozenset[str]:
+        """
+        Get cached valid sound effect IDs as a frozenset for O(1) membership tests.
+        :return: Frozenset of valid sound effect IDs
+        """
+        if self._valid_sound_effect_ids_set_cache is None:
+            self._valid_sound_effect_ids_set_cache = frozenset(self.get_cached_valid_sound_effect_ids())
+        return self._valid_sound_effect_ids_set_cache
+
     def refresh_sound_effect_ids_cache(self, ):
         """Refresh the cache of valid sound effect IDs."""
         self._valid_sound_effect_ids_cache = None
+        self._valid_sound_effect_ids_set_cache = None
+        self._sound_effect_path_cache = None
 
     def parse_sound_effect_markers(self, text: str) -> List[TextSegment]:
         """
@@ -77,42 +103,45 @@ class SoundEffectService:
                 TextSegment(text=' world')
             ]
         """
-        segments = []
-
-        # Pattern to match JSON objects like {"sound_effect_id": "xxx"}
-        pattern = r'\{\s*"sound_effect_id"\s*:\s*"([^"]+)"\s*\}'
+        # Fast path: plain text without any marker skips the regex engine entirely
+        if 'sound_effect_id' not in text:
+            return [TextSegment(text=text)]
 
         # Get valid sound effect IDs
-        valid_ids = self.get_cached_valid_sound_effect_ids()
+        valid_ids = self.get_cached_valid_sound_effect_ids_set()
+
+        # No sound effects installed, or no JSON object at all: markers could only ever be kept as text
+        if not valid_ids or '{' not in text:
+            return [TextSegment(text=text)]
 
+        # Collect (start, end, id) spans in one regex pass
+        spans = [(match.start(), match.end(), match.group(1)) for match in _SFX_RE.finditer(text)]
+
+        # If no markers found, return the whole text as a single segment
+        if not spans:
+            return [TextSegment(text=text)]
+
+        # When every marker is valid, skip the per-marker validation below
+        all_valid = all(sound_effect_id in valid_ids for _, _, sound_effect_id in spans)
+
+        segments = []
         last_end = 0
-        for match in re.finditer(pattern, text):
+        for start, end, sound_effect_id in spans:
             # Add text before the match
-            if match.start() > last_end:
-                segment_text = text[last_end:match.start()]
-                if segment_text:
-                    segments.append(TextSegment(text=segment_text))
-
-            # Add sound effect marker
-            sound_effect_id = match.group(1)
-            # Validate sound effect ID
-            if sound_effect_id in valid_ids:
+            if start > last_end:
+                segments.append(TextSegment(text=text[last_end:start]))
+
+            # Add sound effect marker if valid, otherwise keep it as text
+            if all_valid or sound_effect_id in valid_ids:
                 segments.append(TextSegment(sound_effect_id=sound_effect_id))
             else:
-                # If invalid, keep it as text
-                segments.append(TextSegment(text=match.group(0)))
+                segments.append(TextSegment(text=text[start:end]))
 
-            last_end = match.end()
+            last_end = end
 
         # Add remaining text
         if last_end < len(text):
-            segment_text = text[last_end:]
-            if segment_text:
-                segments.append(TextSegment(text=segment_text))
-
-        # If no markers found, return the whole text as a single segment
-        if not segments:
-            segments.append(TextSegment(text=text))
+            segments.append(TextSegment(text=text[last_end:]))
 
         return segments
 
@@ -123,13 +152,12 @@ class SoundEffectService:
         :param sounds_dir: The base directory for sounds (default: resources/static/sounds/effect)
         :return: Path to the sound file, or None if not found
         """
-        if sounds_dir is None:
-            sounds_dir = self._sound_effect_dir
-
-        # Supported audio file extensions (in order of preference)
-        audio_extensions = ['.mp3', '.wav', '.ogg', '.m4a', '.flac']
+        if sounds_dir is None or Path(sounds_dir) == self._sound_effect_dir:
+            if self._sound_effect_path_cache is None:
+                self._valid_sound_effect_ids_cache = self.get_valid_sound_effect_ids()
+            return self._sound_effect_path_cache.get(sound_effect_id)
 
-        for ext in audio_extensions:
+        for ext in _AUDIO_EXTENSIONS:
             sound_file = sounds_dir / f"{sound_effect_id}{ext}"
             if sound_file.exists():
                 return sound_file
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from common.utils import audio_dsp
+
+
+def _reference_rms(x: np.ndarray) -> float:
+    if x.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(x.astype(np.float64) ** 2)))
+
+
+def _cases():
+    rng = np.random.default_rng(0)
+    return [
+        np.zeros(0, dtype=np.int16),
+        np.zeros(160, dtype=np.int16),
+        np.array([1, -1, 2, -2], dtype=np.int16),
+        # Full-scale values would overflow if squared in int16
+        np.array([32767, -32768] * 100, dtype=np.int16),
+        rng.integers(-32768, 32768, size=16000, dtype=np.int16),
+    ]
+
+
+@pytest.mark.parametrize("buf", _cases())
+def test_rms_int16_fallback(buf: np.ndarray):
+    assert audio_dsp._rms_int16_py(buf) == pytest.approx(_reference_rms(buf), rel=1e-9)
+
+
+@pytest.mark.parametrize("buf", _cases())
+def test_rms_int16_jit(buf: np.ndarray):
+    if audio_dsp._rms_int16_jit is None:
+        pytest.skip("numba is not installed")
+    assert audio_dsp._rms_int16_jit(buf) == pytest.approx(_reference_rms(buf), rel=1e-6)
+
+
+@pytest.mark.parametrize("buf", _cases())
+def test_rms_int16(buf: np.ndarray):
+    assert audio_dsp.rms_int16(buf) == pytest.approx(_reference_rms(buf), rel=1e-6)
+
+
+def test_rms_int16_from_pcm_bytes():
+    pcm = np.array([3, -4] * 50, dtype=np.int16).tobytes()
+    assert audio_dsp.rms_int16(np.frombuffer(pcm, dtype=np.int16)) == pytest.approx(np.sqrt(12.5))
@@ -0,0 +1,10 @@
+from common.utils.openai_url import normalize
+
+
+def test_normalize():
+    assert normalize("https://api.openai.com/v1") == "https://api.openai.com/v1"
+    assert normalize("https://api.openai.com") == "https://api.openai.com/v1"
+    assert normalize("https://api.openai.com/") == "https://api.openai.com/v1"
+    # Used to become `/v1/v1`
+    assert normalize("https://api.openai.com/v1/") == "https://api.openai.com/v1"
+    assert normalize("http://127.0.0.1:8000/compatible-mode//") == "http://127.0.0.1:8000/compatible-mode/v1"
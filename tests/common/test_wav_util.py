@@ -0,0 +1,31 @@
+import io
+import wave
+
+from common.utils.wav_util import WAV_HEADER_SIZE, make_wav_header_template, fill_wav_header
+
+
+def _wave_bytes(channels: int, sample_rate: int, sample_width: int, pcm: bytes) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as f:
+        f.setnchannels(channels)
+        f.setsampwidth(sample_width)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm)
+    return buf.getvalue()
+
+
+def test_fill_wav_header_matches_wave():
+    for channels, sample_rate, sample_width in [(1, 16000, 2), (2, 44100, 2), (1, 8000, 1)]:
+        for pcm in [b'', bytes(range(256)) * 10]:
+            expected = _wave_bytes(channels, sample_rate, sample_width, pcm)
+            template = make_wav_header_template(channels, sample_rate, sample_width)
+            header = fill_wav_header(template, len(pcm))
+            assert len(header) == WAV_HEADER_SIZE
+            assert header + pcm == expected, f"Header mismatch for {(channels, sample_rate, sample_width, len(pcm))}"
+
+
+def test_fill_wav_header_does_not_modify_template():
+    template = make_wav_header_template(1, 16000)
+    original = bytes(template)
+    fill_wav_header(template, 1234)
+    assert template == original
@@ -0,0 +1,26 @@
+import pytest
+
+from devices.headless import is_headless
+
+if is_headless():
+    pytest.skip("SmartKeyboard needs a display", allow_module_level=True)
+
+from devices.keyboard import SmartKeyboard
+
+
+def test_hotkeys():
+    kb = SmartKeyboard(["f8", "f9", "a"])
+    assert kb.str_to_key("F8") == kb.str_to_key("f8")
+
+
+def test_duplicate_hotkeys():
+    with pytest.raises(ValueError):
+        SmartKeyboard(["f8", "f8"])
+    # Different spellings of the same key are duplicates as well
+    with pytest.raises(ValueError):
+        SmartKeyboard(["f8", " F8 "])
+
+
+def test_unknown_hotkey():
+    with pytest.raises(ValueError):
+        SmartKeyboard(["not-a-key"])
@@ -0,0 +1,53 @@
+import pytest
+from requests import Response
+from zerolan.data.pipeline.ocr import OCRPrediction, RegionResult, Position, Vector2D
+from zerolan.data.pipeline.vid_cap import VidCapPrediction
+
+from pipeline.ocr import ocr_sync
+from pipeline.ocr.ocr_sync import OCRSyncPipeline
+from pipeline.vidcap import vidcap_sync
+from pipeline.vidcap.vidcap_sync import VidCapSyncPipeline
+
+
+def _response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+def _position(y: float) -> Position:
+    return Position(lu=Vector2D(x=0.0, y=y), ru=Vector2D(x=1.0, y=y),
+                    rd=Vector2D(x=1.0, y=y + 1), ld=Vector2D(x=0.0, y=y + 1))
+
+
+@pytest.mark.parametrize("typecheck", [False, True])
+def test_ocr_parse_prediction(monkeypatch, typecheck: bool):
+    monkeypatch.setattr(ocr_sync, "TYPECHECK", typecheck)
+    expected = OCRPrediction(region_results=[
+        RegionResult(content="我是赤川鹤鸣", confidence=0.98, position=_position(0.0)),
+        RegionResult(content="hello", confidence=0.5, position=_position(2.0)),
+    ])
+    # Skip `__init__`, parsing does not depend on the pipeline configuration
+    pipeline = OCRSyncPipeline.__new__(OCRSyncPipeline)
+
+    prediction = pipeline.parse_prediction(_response(expected.model_dump_json().encode("utf-8")))
+
+    assert isinstance(prediction, OCRPrediction)
+    assert isinstance(prediction.region_results[0], RegionResult)
+    assert isinstance(prediction.region_results[0].position, Position)
+    assert isinstance(prediction.region_results[0].position.rd, Vector2D)
+    assert prediction.model_dump() == expected.model_dump()
+
+
+@pytest.mark.parametrize("typecheck", [False, True])
+def test_vidcap_parse_prediction(monkeypatch, typecheck: bool):
+    monkeypatch.setattr(vidcap_sync, "TYPECHECK", typecheck)
+    expected = VidCapPrediction(caption="A cat is playing with a ball.")
+    pipeline = VidCapSyncPipeline.__new__(VidCapSyncPipeline)
+
+    # Used to call `model_validate` on the raw response bytes
+    prediction = pipeline.parse_prediction(_response(expected.model_dump_json().encode("utf-8")))
+
+    assert isinstance(prediction, VidCapPrediction)
+    assert prediction.model_dump() == expected.model_dump()
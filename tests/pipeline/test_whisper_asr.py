@@ -0,0 +1,27 @@
+from pipeline.asr.whisper_asr import _ChainedReader
+
+
+def test_chained_reader_read_across_parts():
+    reader = _ChainedReader(b'RIFF', b'', b'abcdef', b'xy')
+    assert reader.len == 12
+    assert reader.read(2) == b'RI'
+    assert reader.len == 10
+    # Crosses the boundary of the first and the (skipped empty) second part
+    assert reader.read(4) == b'FFab'
+    assert reader.len == 6
+    # Crosses the boundary of the last two parts
+    assert reader.read(5) == b'cdefx'
+    assert reader.len == 1
+    assert reader.read(100) == b'y'
+    assert reader.len == 0
+    assert reader.read(1) == b''
+
+
+def test_chained_reader_read_all():
+    reader = _ChainedReader(b'header', bytearray(b'payload'))
+    assert reader.read() == b'headerpayload'
+    assert reader.len == 0
+    assert reader.read() == b''
+
+    reader = _ChainedReader(b'ab', b'cd')
+    assert reader.read(None) == b'abcd'
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from services.sound_effect.config import SoundEffectConfig
+from services.sound_effect.service import SoundEffectService
+
+
+@pytest.fixture
+def sfx_dir(tmp_path: Path) -> Path:
+    (tmp_path / "bruh.mp3").write_bytes(b"")
+    (tmp_path / "bruh.wav").write_bytes(b"")
+    (tmp_path / "ding.wav").write_bytes(b"")
+    (tmp_path / "ding.ogg").write_bytes(b"")
+    (tmp_path / "LOUD.FLAC").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+    # A directory with an audio-like name is not a sound effect
+    (tmp_path / "folder.mp3").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def service(sfx_dir: Path) -> SoundEffectService:
+    return SoundEffectService(SoundEffectConfig(sound_effect_dir=str(sfx_dir)))
+
+
+def test_valid_sound_effect_ids(service: SoundEffectService):
+    assert service.get_valid_sound_effect_ids() == ["LOUD", "bruh", "ding"]
+
+
+def test_get_sound_effect_path(service: SoundEffectService, sfx_dir: Path):
+    # Extension preference order: .mp3 > .wav > .ogg > .m4a > .flac
+    assert service.get_sound_effect_path("bruh") == sfx_dir / "bruh.mp3"
+    assert service.get_sound_effect_path("ding") == sfx_dir / "ding.wav"
+    # Uppercase extensions resolve as well
+    assert service.get_sound_effect_path("LOUD") == sfx_dir / "LOUD.FLAC"
+    assert service.get_sound_effect_path("folder") is None
+    assert service.get_sound_effect_path("notes") is None
+    assert service.get_sound_effect_path("missing") is None
+
+
+def test_refresh_sound_effect_ids_cache(service: SoundEffectService, sfx_dir: Path):
+    assert service.get_sound_effect_path("new") is None
+    (sfx_dir / "new.ogg").write_bytes(b"")
+    service.refresh_sound_effect_ids_cache()
+    assert service.get_sound_effect_path("new") == sfx_dir / "new.ogg"
+    assert "new" in service.get_cached_valid_sound_effect_ids_set()
+
+
+def _as_tuples(segments):
+    return [(s.text, s.sound_effect_id) for s in segments]
+
+
+def test_parse_sound_effect_markers(service: SoundEffectService):
+    text = 'Hello {"sound_effect_id": "bruh"} world{ "sound_effect_id" : "ding" }!'
+    assert _as_tuples(service.parse_sound_effect_markers(text)) == [
+        ("Hello ", None),
+        (None, "bruh"),
+        (" world", None),
+        (None, "ding"),
+        ("!", None),
+    ]
+
+
+def test_parse_sound_effect_markers_invalid_id_kept_as_text(service: SoundEffectService):
+    text = '{"sound_effect_id": "bruh"}{"sound_effect_id": "unknown"} end'
+    assert _as_tuples(service.parse_sound_effect_markers(text)) == [
+        (None, "bruh"),
+        ('{"sound_effect_id": "unknown"}', None),
+        (" end", None),
+    ]
+
+
+def test_parse_sound_effect_markers_plain_text(service: SoundEffectService):
+    for text in ["", "no markers here", "sound_effect_id without braces"]:
+        assert _as_tuples(service.parse_sound_effect_markers(text)) == [(text, None)]
+
+
+def test_parse_sound_effect_markers_no_sound_effects(tmp_path: Path):
+    service = SoundEffectService(SoundEffectConfig(sound_effect_dir=str(tmp_path)))
+    text = 'Hello {"sound_effect_id": "bruh"}'
+    assert _as_tuples(service.parse_sound_effect_markers(text)) == [(text, None)]